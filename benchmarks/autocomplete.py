@@ -0,0 +1,51 @@
+"""
+Time completing prefixes from the names of the chapters, components and
+props, with and without the cache of recent prefixes.
+
+    python -m benchmarks.autocomplete
+"""
+from __future__ import print_function
+import time
+import timeit
+
+from tutorial import chapter_index
+from tutorial.utils.autocomplete import Autocomplete
+
+NUMBER = 10000
+
+PREFIXES = [
+    'd',
+    'dr',
+    'drop',
+    'range',
+    'date picker',
+    'n_cl',
+    'value',
+    'not a name'
+]
+
+
+def run_benchmark():
+    start = time.time()
+    suggestions = chapter_index.autocomplete_suggestions()
+    uncached = Autocomplete(suggestions, cache_size=0)
+    built = time.time()
+    cached = Autocomplete(suggestions)
+    print('{} suggestions, {} keys, building: {:.3f}s\n'.format(
+        len(uncached), len(uncached._keys), built - start))
+
+    print('{:<20}{:>6}{:>12}{:>12}'.format(
+        'prefix', 'hits', 'uncached', 'cached'))
+    for prefix in PREFIXES:
+        times = [
+            timeit.timeit(
+                lambda: autocomplete.complete(prefix), number=NUMBER) / NUMBER
+            for autocomplete in (uncached, cached)
+        ]
+        print('{:<20}{:>6}{:>10.1f}us{:>10.1f}us'.format(
+            prefix, len(uncached.complete(prefix)),
+            times[0] * 1e6, times[1] * 1e6))
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,78 @@
+"""
+Compare the size of each route's response and the CPU time spent
+compressing it: on the fly with Flask-Compress' defaults (gzip level 6,
+paid on every request) against precompressing it once with
+`utils.payloads.compress` (gzip level 9 and, if installed, brotli).
+
+    python -m benchmarks.compression
+"""
+from __future__ import print_function
+import json
+import timeit
+from gzip import GzipFile
+from io import BytesIO
+
+from tutorial import run
+from tutorial.utils import payloads
+
+NUMBER = 20
+
+
+def gzip_on_the_fly(body):
+    buffer = BytesIO()
+    with GzipFile(mode='wb', compresslevel=6, fileobj=buffer) as f:
+        f.write(body)
+    return buffer.getvalue()
+
+
+def responses():
+    client = run.server.test_client()
+    for path in ['/_dash-layout', '/_dash-dependencies']:
+        yield path, client.get(path).get_data()
+    for key, chapter in sorted(run.chapters.items()):
+        response = client.post('/_dash-update-component', data=json.dumps({
+            'output': {'id': 'chapter', 'property': 'children'},
+            'inputs': [{'id': 'location', 'property': 'pathname',
+                        'value': chapter['url']}]
+        }), content_type='application/json')
+        if response.status_code == 200:
+            yield chapter['url'], response.get_data()
+
+
+def milliseconds(compress, body):
+    return 1000 * timeit.timeit(lambda: compress(body), number=NUMBER) / NUMBER
+
+
+def run_benchmark():
+    encodings = [('gzip-9', lambda body: payloads.compress(body, 'gzip'))]
+    if payloads.brotli is not None:
+        encodings.append(('br', lambda body: payloads.compress(body, 'br')))
+
+    columns = ['identity', 'gzip-6'] + [name for name, _ in encodings]
+    print('{:<45}'.format('route') + ''.join(
+        '{:>10}{:>9}'.format(name, 'ms') for name in columns[1:]) +
+        '{:>10}'.format('identity'))
+
+    totals = dict((name, 0) for name in columns)
+    for path, body in responses():
+        sizes = [('gzip-6', len(gzip_on_the_fly(body)),
+                  milliseconds(gzip_on_the_fly, body))]
+        for name, compress in encodings:
+            sizes.append((name, len(compress(body)),
+                          milliseconds(compress, body)))
+        print('{:<45}'.format(path) + ''.join(
+            '{:>10}{:>9.2f}'.format(size, ms) for _, size, ms in sizes) +
+            '{:>10}'.format(len(body)))
+        totals['identity'] += len(body)
+        for name, size, _ in sizes:
+            totals[name] += size
+
+    print('\nbytes per request for every route, gzip-6 paid on each request, '
+          'the others once per worker:')
+    for name in columns:
+        print('{:>10}: {:>9} ({:.1%} saved)'.format(
+            name, totals[name], 1 - float(totals[name]) / totals['identity']))
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,95 @@
+"""
+Report the size of every chapter's layout (the chapter router's response)
+and of the app's layout: the bytes of their JSON, how many components they
+have and how deep they are, their largest subtrees and the subtrees that
+they repeat.
+
+    python -m benchmarks.layout_budget
+    python -m benchmarks.layout_budget --bytes 50000 --nodes 400 --depth 10
+
+Exits with 1 if a layout exceeds the budget (the defaults below, or the
+limits passed as arguments) or fails to load.
+"""
+from __future__ import print_function
+import argparse
+import sys
+
+from tutorial import run
+from tutorial.utils.layout_metrics import BUDGET_METRICS, measure, over_budget
+
+# about twice the largest chapter (the date picker reference pages)
+BUDGET = {
+    'bytes': 100 * 1000,
+    'nodes': 1000,
+    'depth': 15
+}
+
+
+def layouts():
+    yield '/_dash-layout', lambda: run.app.layout
+    for key, chapter in sorted(run.chapters.items(),
+                               key=lambda c: c[1]['url']):
+        yield chapter['url'], lambda key=key: run.chapter_content(key)
+
+
+def _path(path):
+    return ' > '.join(path)
+
+
+def report(budget=BUDGET, top=5):
+    """
+    Print the metrics of every layout and return the routes that are over
+    `budget` or failed to load.
+    """
+    measured = []
+    failures = []
+    for route, layout in layouts():
+        try:
+            measured.append((route, measure(layout(), top=top)))
+        except Exception as e:
+            print('Error loading {}: {}'.format(route, e))
+            failures.append(route)
+
+    print('\n{:<45}{:>10}{:>8}{:>7}'.format('route', 'bytes', 'nodes', 'depth'))
+    for route, metrics in sorted(measured, key=lambda m: m[1]['bytes'],
+                                 reverse=True):
+        exceeded = over_budget(metrics, budget)
+        print('{:<45}{:>10}{:>8}{:>7}{}'.format(
+            route, metrics['bytes'], metrics['nodes'], metrics['depth'],
+            '  over budget' if exceeded else ''))
+        if exceeded:
+            failures.append(route)
+
+    for route, metrics in measured:
+        print('\n{}'.format(route))
+        for metric, value, limit in over_budget(metrics, budget):
+            print('  over budget: {} {} > {}'.format(metric, value, limit))
+        print('  largest subtrees:')
+        for size, path in metrics['largest']:
+            print('    {:>9}  {}'.format(size, _path(path)))
+        if metrics['duplicates']:
+            print('  repeated subtrees (bytes wasted, copies, bytes):')
+        for wasted, copies, size, path in metrics['duplicates']:
+            print('    {:>9} {:>3}x {:>9}  {}'.format(
+                wasted, copies, size, _path(path)))
+
+    return failures
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    for metric in BUDGET_METRICS:
+        parser.add_argument(
+            '--{}'.format(metric), type=int, default=BUDGET[metric],
+            help='the maximum {} of a layout (default: %(default)s)'.format(
+                metric))
+    parser.add_argument('--top', type=int, default=5,
+                        help='the number of subtrees to list per layout')
+    args = parser.parse_args()
+    failures = report(
+        dict((metric, getattr(args, metric)) for metric in BUDGET_METRICS),
+        top=args.top)
+    if failures:
+        print('\nOver budget or failed to load:\n{}'.format(
+            '\n'.join(failures)))
+        sys.exit(1)
@@ -0,0 +1,59 @@
+"""
+Compare the route table used by `display_content` against the linear scan
+over `chapters` that it replaced.
+
+    python -m benchmarks.routes
+
+The chapters are synthetic so that the comparison can be run for sizes
+well beyond the current user guide without importing any chapter.
+"""
+from __future__ import print_function
+import timeit
+
+from tutorial.utils.routes import RouteTable
+
+SIZES = [10, 100, 1000, 10000]
+NUMBER = 2000
+
+
+def make_chapters(n):
+    chapters = {'index': {'url': '/'}}
+    for i in range(n):
+        chapters['chapter-{}'.format(i)] = {
+            'url': '/dash-core-components/component-{}'.format(i)
+        }
+    return chapters
+
+
+def linear_scan(chapters, pathname):
+    if pathname.endswith('/') and pathname != '/':
+        pathname = pathname[:len(pathname) - 1]
+    matched = [c for c in chapters.keys()
+               if chapters[c]['url'] == pathname]
+    return matched[0] if matched else 'index'
+
+
+def run():
+    print('{:>8} {:>14} {:>14} {:>14}'.format(
+        'chapters', 'scan (us)', 'table (us)', 'prefix (us)'))
+    for n in SIZES:
+        chapters = make_chapters(n)
+        routes = RouteTable(chapters)
+        # the last chapter is the worst case for the scan
+        pathname = '/dash-core-components/component-{}/'.format(n - 1)
+        nested = '/dash-core-components/component-{}/unknown'.format(n - 1)
+        assert linear_scan(chapters, pathname) == routes.resolve(pathname)
+
+        def per_call(func):
+            return 1e6 * timeit.timeit(func, number=NUMBER) / NUMBER
+
+        print('{:>8} {:>14.2f} {:>14.2f} {:>14.2f}'.format(
+            n,
+            per_call(lambda: linear_scan(chapters, pathname)),
+            per_call(lambda: routes.resolve(pathname)),
+            per_call(lambda: routes.resolve(nested))
+        ))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,54 @@
+"""
+Time building the search index of every chapter and answering queries
+with it.
+
+    python -m benchmarks.search
+"""
+from __future__ import print_function
+import time
+import timeit
+
+from tutorial import chapter_index
+from tutorial.utils.search import SearchIndex
+
+NUMBER = 1000
+
+QUERIES = [
+    'dropdown',
+    'drop',
+    'd',
+    'updatemode',
+    'multi page apps',
+    'how to deploy on heroku',
+    'dcc.Graph clickData hoverData',
+    'callback state',
+    'upload csv file',
+    'not a word in the docs'
+]
+
+
+def run_benchmark():
+    start = time.time()
+    documents = chapter_index.search_documents()
+    loaded = time.time()
+    index = SearchIndex(documents)
+    built = time.time()
+    print('{} documents, {} characters, {} terms'.format(
+        len(documents), sum(len(d['content']) for d in documents),
+        len(index.terms)))
+    print('loading the chapters: {:.3f}s, building the index: {:.3f}s\n'.format(
+        loaded - start, built - loaded))
+
+    print('{:<35}{:>6}{:>12}'.format('query', 'hits', 'per query'))
+    total = 0
+    for query in QUERIES:
+        seconds = timeit.timeit(
+            lambda: index.search(query), number=NUMBER) / NUMBER
+        total += seconds
+        print('{:<35}{:>6}{:>10.1f}us'.format(
+            query, len(index.search(query)), seconds * 1e6))
+    print('\nmean: {:.1f}us'.format(total / len(QUERIES) * 1e6))
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,40 @@
+"""
+Time how long it takes to import every chapter and report how long each
+example took to load.
+
+    python -m benchmarks.startup            # examples run concurrently
+    python -m benchmarks.startup --serial   # examples run one at a time
+
+Run it with DASH_DOCS_CACHE_DIR= to measure a cold example cache.
+"""
+from __future__ import print_function
+import sys
+import time
+
+from tutorial import chapter_index, tools
+from tutorial.utils.lazy import lazy_layouts
+
+
+def run(serial=False):
+    start = time.time()
+    if serial:
+        for chapter in chapter_index.chapters.values():
+            for layout in lazy_layouts(chapter['content']):
+                try:
+                    layout.load()
+                except Exception as e:
+                    print('Error loading {}: {}'.format(layout, e))
+    else:
+        chapter_index.warm_up_chapters(background=False)
+    total = time.time() - start
+
+    print(tools.timings_report())
+    print('\n{} examples, {:.3f}s spent in examples, {:.3f}s total'.format(
+        len(tools.example_timings),
+        sum(tools.example_timings.values()),
+        total
+    ))
+
+
+if __name__ == '__main__':
+    run(serial='--serial' in sys.argv)
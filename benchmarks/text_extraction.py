@@ -0,0 +1,55 @@
+"""
+Compare extracting the text of every chapter for the search index with
+`text_records` against the `str(layout)` that dash_search_index.py used.
+
+    python -m benchmarks.text_extraction
+"""
+from __future__ import print_function
+import timeit
+
+from tutorial import chapter_index
+from tutorial.utils.text_records import text_records
+
+NUMBER = 5
+
+
+def repr_text(layout):
+    content = str(layout)
+    content = content.replace("'", '')
+    content = content.replace('"', '')
+    content = content.replace('\\n', '')
+    return content
+
+
+def records_text(layout):
+    return u'\n'.join(record.text for record in text_records(layout))
+
+
+def milliseconds(extract, layout):
+    return 1000 * timeit.timeit(
+        lambda: extract(layout), number=NUMBER) / NUMBER
+
+
+def run_benchmark():
+    chapter_index.warm_up_chapters(background=False)
+    print('{:<45}{:>10}{:>9}{:>10}{:>9}{:>9}'.format(
+        'chapter', 'repr', 'ms', 'records', 'ms', 'records'))
+    totals = [0, 0, 0, 0]
+    for key, chapter in sorted(chapter_index.chapters.items(),
+                               key=lambda c: c[1]['url']):
+        try:
+            layout = chapter_index.load(key)
+        except Exception:
+            continue
+        row = [
+            len(repr_text(layout)), milliseconds(repr_text, layout),
+            len(records_text(layout)), milliseconds(records_text, layout)
+        ]
+        totals = [t + r for t, r in zip(totals, row)]
+        print('{:<45}{:>10}{:>9.2f}{:>10}{:>9.2f}{:>9}'.format(
+            chapter['url'], *(row + [len(list(text_records(layout)))])))
+    print('{:<45}{:>10}{:>9.2f}{:>10}{:>9.2f}'.format('total', *totals))
+
+
+if __name__ == '__main__':
+    run_benchmark()
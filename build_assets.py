@@ -0,0 +1,10 @@
+# Bundle the stylesheets and scripts of the docs into
+# tutorial/static/bundles (see tutorial/utils/asset_pipeline.py). Without
+# the bundles the app falls back to loading them from their CDNs.
+
+from tutorial.utils.asset_pipeline import BUNDLE_DIR, build
+
+
+if __name__ == '__main__':
+    for name, filename in sorted(build().items()):
+        print('{} -> {}/{}'.format(name, BUNDLE_DIR, filename))
@@ -0,0 +1,10 @@
+# Render the dash_core_components prop tables into
+# tutorial/utils/prop_tables.json so that the server doesn't have to parse
+# metadata.json on startup. Rerun after upgrading dash-core-components.
+
+from tutorial.utils.convert_props_to_table import ARTIFACT_PATH, write_artifact
+
+
+if __name__ == '__main__':
+    write_artifact()
+    print('Wrote {}'.format(ARTIFACT_PATH))
@@ -1,31 +1,54 @@
-# Update dash-doc search index: https://www.algolia.com/apps/7EK9KHJW8M/explorer/browse/dash_docs
+"""
+Update the dash-docs search index:
+https://www.algolia.com/apps/7EK9KHJW8M/explorer/browse/dash_docs
 
+    python dash_search_index.py                      # needs ALGOLIA_API_KEY
+    python dash_search_index.py --file index.json    # a local JSON file
+
+Only the records that changed since the last run are pushed, see
+`tutorial.utils.index_sync`. The hashes of the pushed records are stored
+in search_index_manifest.json (or DASH_DOCS_SEARCH_MANIFEST); without it,
+every record is pushed again.
+"""
+from __future__ import print_function
 import os
+import sys
+
+from tutorial.chapter_index import search_documents
+from tutorial.utils.index_sync import AlgoliaBackend, FileBackend, sync
+
+MANIFEST_PATH = os.environ.get(
+    'DASH_DOCS_SEARCH_MANIFEST', 'search_index_manifest.json')
+
+
+def backend():
+    if len(sys.argv) > 2 and sys.argv[1] == '--file':
+        return FileBackend(sys.argv[2])
+
+    from algoliasearch import algoliasearch
+    # Algolia Credentials
+    client = algoliasearch.Client('7EK9KHJW8M', os.environ['ALGOLIA_API_KEY'])
+    return AlgoliaBackend(client.init_index('dash_docs'))
+
+
+def records():
+    # the text of every section of every chapter: headings, paragraphs,
+    # Markdown, code and the rows of the prop tables, see
+    # `tutorial.utils.text_records`
+    return [
+        {
+            'objectID': document['key'],
+            'name': document['name'],
+            'section': document['section'],
+            'permalink': 'https://plot.ly' + document['url'],
+            'description': document['description'],
+            'content': document['content']
+        }
+        for document in search_documents()
+    ]
+
 
-from algoliasearch import algoliasearch
-from tutorial.chapter_index import chapters
-
-# Algolia Credentials
-client = algoliasearch.Client('7EK9KHJW8M', os.environ['ALGOLIA_API_KEY'])
-index = client.init_index('dash_docs')
-
-dash_index = []
-
-for chapter in chapters:
-    chap = {}
-    chap['name'] = chapters[chapter]['name']
-    chap['permalink'] = 'https://plot.ly'+chapters[chapter]['url']
-    chap['description'] = chapters[chapter]['description']
-    if chapter not in ['getting-started', 'getting-started-part-2', 'graphing']:
-        chap_content = str(chapters[chapter]['content'])
-        chap_content = chap_content.replace("'", '')
-        chap_content = chap_content.replace('"', '')
-        chap_content = chap_content.replace('\\n', '')
-        chap['content'] = chap_content
-    else:
-        chap['content'] = ''
-    dash_index.append(chap)
-
-# clear existing remote index and push dash_index to algolia
-index.clear_index()
-index.add_objects(dash_index)
+if __name__ == '__main__':
+    added, updated, deleted = sync(backend(), records(), MANIFEST_PATH)
+    print('{} added, {} updated, {} deleted'.format(
+        len(added), len(updated), len(deleted)))
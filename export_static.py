@@ -0,0 +1,231 @@
+"""
+Export the docs to a directory that can be served by a static web server.
+
+    python export_static.py [output directory]
+
+Every chapter is requested through the Flask app, so the export contains
+exactly what the app serves:
+
+- `<url>/index.html`: the pre-rendered page for each chapter
+- `_dash-layout`: the JSON response
+- `_dash-payloads/<sha1>.json`: the chapter router's response and the
+  callbacks (`_dash-dependencies`) of each chapter, named by their content
+  hash
+- `_static-export/export.<sha1>.js`: a script that answers the renderer's
+  requests for the chapter router and for the callbacks of the page from
+  the payloads above
+- `_dash-component-suites/`: the component bundles that the pages load
+- `static/` and `assets/`, copied from the app
+- `nginx.conf`: a server block for serving the directory
+
+The pages, their navigation and the chapter router are served from files.
+The callbacks of the interactive examples (and the search page's
+completions) run Python code, so they can't be exported: `nginx.conf`
+sends `_dash-update-component` requests for anything but the router, and
+`_autocomplete` requests, to an app server. That's a deliberate limit of
+the export: without that server, the docs still work but the examples
+don't respond.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+
+from tutorial import run
+
+OUTPUT_DIR = 'build'
+
+# the chapter router's output
+_output = {'id': 'chapter', 'property': 'children'}
+
+# the component bundles that the pages load (their query string only busts
+# caches)
+_component_suite = re.compile(r'"(/_dash-component-suites/[^"?]+)[^"]*"')
+
+_script = '''(function () {
+    var routes = %(routes)s;
+    var payloads = %(payloads)s;
+    var dependencies = %(dependencies)s;
+
+    function normalize(pathname) {
+        pathname = (pathname || '/').split('?')[0].split('#')[0];
+        pathname = ('/' + pathname).replace(/\\/{2,}/g, '/');
+        return pathname.length > 1 ? pathname.replace(/\\/+$/, '') : pathname;
+    }
+
+    function resolve(pathname) {
+        pathname = normalize(pathname);
+        while (pathname.length > 1) {
+            if (routes.hasOwnProperty(pathname)) {
+                return routes[pathname];
+            }
+            pathname = pathname.slice(0, pathname.lastIndexOf('/')) || '/';
+        }
+        return routes['/'];
+    }
+
+    var fetch = window.fetch;
+    window.fetch = function (url, options) {
+        // the callbacks of the page that the renderer was loaded on, or of
+        // the page that the chapter router is called for
+        var match = /_dash-dependencies(\?pathname=([^&]*))?$/.exec(url);
+        if (match) {
+            var key = resolve(match[2] ? decodeURIComponent(match[2]) :
+                              window.location.pathname);
+            return fetch(dependencies[key] || dependencies.index, {
+                credentials: 'same-origin'
+            });
+        }
+        if (/_dash-update-component$/.test(url) && options && options.body) {
+            var body = JSON.parse(options.body);
+            if (body.output.id === %(id)s &&
+                    body.output.property === %(property)s) {
+                var key = resolve(body.inputs[0].value);
+                return fetch(payloads[key] || payloads.index, {
+                    credentials: 'same-origin'
+                });
+            }
+        }
+        return fetch.apply(window, arguments);
+    };
+})();
+'''
+
+_nginx_conf = '''server {
+    listen 80;
+    root %(root)s;
+
+    location = /_dash-layout {
+        default_type application/json;
+    }
+
+    # named by their content hash, so they never change
+    location ~ ^/(_dash-payloads|_static-export)/ {
+        add_header Cache-Control "public, max-age=31536000, immutable";
+    }
+
+    location /_dash-component-suites/ {
+        try_files $uri =404;
+    }
+
+    # the callbacks of the interactive examples and the search page's
+    # completions need an app server, see export_static.py
+    location = /_dash-update-component {
+        proxy_pass http://127.0.0.1:8050;
+    }
+
+    location = /_autocomplete {
+        proxy_pass http://127.0.0.1:8050;
+    }
+
+    location / {
+        try_files $uri $uri/index.html /index.html;
+    }
+}
+'''
+
+
+def _fingerprint(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+def _write(output_dir, path, data):
+    path = os.path.join(output_dir, path.lstrip('/'))
+    if not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _write_payload(output_dir, data):
+    path = '/_dash-payloads/{}.json'.format(_fingerprint(data))
+    _write(output_dir, path, data)
+    return path
+
+
+def _copy_tree(source, destination):
+    if os.path.isdir(destination):
+        shutil.rmtree(destination)
+    if os.path.isdir(source):
+        shutil.copytree(source, destination)
+
+
+def export(output_dir=OUTPUT_DIR):
+    """
+    Export the docs to `output_dir` and return the urls of the chapters
+    that failed to render.
+    """
+    client = run.server.test_client()
+    failures = []
+
+    # the router's response and the callbacks of each chapter
+    payloads = {}
+    dependencies = {}
+    for key, chapter in sorted(run.chapters.items()):
+        response = client.post('/_dash-update-component', data=json.dumps({
+            'output': _output,
+            'inputs': [{'id': 'location', 'property': 'pathname',
+                        'value': chapter['url']}]
+        }), content_type='application/json')
+        if response.status_code != 200:
+            failures.append(chapter['url'])
+            continue
+        payloads[key] = _write_payload(output_dir, response.get_data())
+
+        response = client.get('/_dash-dependencies?pathname={}'.format(
+            chapter['url']))
+        if response.status_code != 200:
+            failures.append(chapter['url'])
+            continue
+        dependencies[key] = _write_payload(output_dir, response.get_data())
+
+    script = (_script % {
+        'routes': json.dumps(run.routes.routes, sort_keys=True),
+        'payloads': json.dumps(payloads, sort_keys=True),
+        'dependencies': json.dumps(dependencies, sort_keys=True),
+        'id': json.dumps(_output['id']),
+        'property': json.dumps(_output['property'])
+    }).encode('utf-8')
+    script_path = '/_static-export/export.{}.js'.format(_fingerprint(script))
+    _write(output_dir, script_path, script)
+
+    _write(output_dir, '/_dash-layout',
+           client.get('/_dash-layout').get_data())
+
+    # the pages, with the script loaded before the renderer's
+    component_suites = set()
+    for chapter in run.chapters.values():
+        if chapter['url'] in failures:
+            continue
+        page = client.get(chapter['url']).get_data(as_text=True).replace(
+            '</head>',
+            '<script src="{}"></script>\n</head>'.format(script_path), 1)
+        _write(output_dir, os.path.join(chapter['url'], 'index.html'),
+               page.encode('utf-8'))
+        component_suites.update(_component_suite.findall(page))
+
+    for path in sorted(component_suites):
+        _write(output_dir, path, client.get(path).get_data())
+
+    tutorial_dir = os.path.dirname(os.path.abspath(run.__file__))
+    for directory in ['static', 'assets']:
+        _copy_tree(os.path.join(tutorial_dir, directory),
+                   os.path.join(output_dir, directory))
+
+    _write(output_dir, 'nginx.conf', (_nginx_conf % {
+        'root': os.path.abspath(output_dir)
+    }).encode('utf-8'))
+
+    return failures
+
+
+if __name__ == '__main__':
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else OUTPUT_DIR
+    failures = export(output_dir)
+    print('Exported {} chapters to {}'.format(
+        len(run.chapters) - len(failures), output_dir))
+    if failures:
+        print('Failed to export:\n{}'.format('\n'.join(failures)))
+        sys.exit(1)
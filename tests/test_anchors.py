@@ -0,0 +1,84 @@
+import unittest
+
+import dash_core_components as dcc
+import dash_html_components as html
+
+from tutorial.utils.anchors import add_anchors, slugify, split_markdown
+from tutorial.utils.search import sections
+
+
+class AnchorsTests(unittest.TestCase):
+    def test_slugify(self):
+        self.assertEqual(slugify('Dropdown Props'), 'dropdown-props')
+        self.assertEqual(slugify('`dcc.Graph` & co.'), 'dcc-graph-co')
+        self.assertEqual(slugify('???'), 'section')
+
+    def test_split_markdown(self):
+        source = '\n'.join([
+            'Intro',
+            '## First',
+            '```',
+            '## not a heading',
+            '```',
+            '#### Smaller',
+            '### Second ###',
+        ])
+        self.assertEqual(split_markdown(source), [
+            (None, 'Intro'),
+            ('First', '## First\n```\n## not a heading\n```\n#### Smaller'),
+            ('Second', '### Second ###'),
+        ])
+        self.assertEqual(split_markdown('# Title\nText'),
+                         [(None, '# Title\nText')])
+
+    def test_add_anchors(self):
+        tree = html.Div([
+            html.H1('Dropdown'),
+            html.H2('Props', id='existing'),
+            html.H3('Examples'),
+            dcc.Markdown('Intro\n## Examples\nText', className='md'),
+            html.H3('examples-2'),
+        ])
+        anchored = add_anchors(tree)
+        self.assertFalse(hasattr(tree.children[2], 'id'))
+        self.assertFalse(hasattr(anchored.children[0], 'id'))
+        self.assertEqual(anchored.children[1].id, 'existing')
+        self.assertEqual(anchored.children[2].id, 'examples')
+
+        intro, section = anchored.children[3].children
+        self.assertEqual(intro.children, 'Intro')
+        self.assertFalse(hasattr(intro, 'id'))
+        self.assertEqual(section.children, '## Examples\nText')
+        self.assertEqual(section.id, 'examples-2')
+        self.assertEqual(section.className, 'md')
+
+        self.assertEqual(anchored.children[4].id, 'examples-2-2')
+
+    def test_taken(self):
+        tree = html.Div([html.H2('Chapter'), html.H2('Location')])
+        anchored = add_anchors(tree, taken=['chapter', 'location'])
+        self.assertEqual([c.id for c in anchored.children],
+                         ['chapter-2', 'location-2'])
+
+    def test_stable(self):
+        def tree():
+            return html.Div([html.H2('Usage'), dcc.Markdown('## Usage')])
+        first, second = add_anchors(tree()), add_anchors(tree())
+        self.assertEqual(first.children[0].id, second.children[0].id)
+        self.assertEqual(first.children[1].children[0].id, 'usage-2')
+        # anchoring a tree again doesn't change its anchors
+        self.assertEqual(add_anchors(first).children[1].children[0].id,
+                         'usage-2')
+
+    def test_sections(self):
+        tree = add_anchors(html.Div([
+            html.H1('Dropdown'),
+            dcc.Markdown('Intro\n## Multi\nText\n#### Details\nMore'),
+            html.H3('Props'),
+            html.P('Rows'),
+        ]))
+        self.assertEqual(list(sections(tree)), [
+            (None, None, 'Dropdown\nIntro'),
+            ('multi', 'Multi', 'Text\nDetails\nMore'),
+            ('props', 'Props', 'Rows'),
+        ])
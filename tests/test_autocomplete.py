@@ -0,0 +1,73 @@
+import unittest
+
+from tutorial.utils.autocomplete import (
+    Autocomplete, Suggestion, keys, normalize)
+
+SUGGESTIONS = [
+    Suggestion('Dropdown.value', 'prop', '/dropdown'),
+    Suggestion('Dropdown', 'component', '/dropdown'),
+    Suggestion('DatePickerRange', 'component', '/date-picker-range'),
+    Suggestion('Dropdown Component', 'chapter', '/dropdown'),
+    Suggestion('Slider.n_clicks', 'prop', '/slider'),
+    Suggestion('Deployment', 'chapter', '/deployment'),
+]
+
+
+class AutocompleteTests(unittest.TestCase):
+    def setUp(self):
+        self.autocomplete = Autocomplete(SUGGESTIONS)
+
+    def texts(self, prefix, limit=10):
+        return [s.text for s in self.autocomplete.complete(prefix, limit)]
+
+    def test_keys(self):
+        self.assertEqual(normalize(u'Date Picker: Range'), u'datepickerrange')
+        self.assertEqual(
+            keys(u'DatePickerRange'),
+            [u'datepickerrange', u'pickerrange', u'range'])
+        self.assertEqual(
+            keys(u'Slider.n_clicks'),
+            [u'clicks', u'nclicks', u'slidernclicks'])
+
+    def test_ranking(self):
+        # chapters, then components, then props, shortest first
+        self.assertEqual(self.texts('d'), [
+            'Deployment', 'Dropdown Component', 'Dropdown',
+            'DatePickerRange', 'Dropdown.value'])
+        self.assertEqual(self.texts('d', limit=2),
+                         ['Deployment', 'Dropdown Component'])
+
+    def test_word_starts(self):
+        self.assertEqual(self.texts('range'), ['DatePickerRange'])
+        self.assertEqual(self.texts('picker r'), ['DatePickerRange'])
+        self.assertEqual(self.texts('VALUE'), ['Dropdown.value'])
+        self.assertEqual(self.texts('n_cl'), ['Slider.n_clicks'])
+        self.assertEqual(self.texts('clicks'), ['Slider.n_clicks'])
+        # only the starts of words
+        self.assertEqual(self.texts('ropdown'), [])
+
+    def test_no_completions(self):
+        self.assertEqual(self.texts(''), [])
+        self.assertEqual(self.texts(' . '), [])
+        self.assertEqual(self.texts('zzz'), [])
+
+    def test_duplicates(self):
+        autocomplete = Autocomplete(SUGGESTIONS + [
+            Suggestion('Dropdown', 'prop', '/other'),
+            Suggestion('Deployment', 'chapter', '/other'),
+        ])
+        self.assertEqual(len(autocomplete), len(SUGGESTIONS))
+        self.assertEqual(
+            [s.url for s in autocomplete.complete('d') if s.text in
+             ('Dropdown', 'Deployment')],
+            ['/deployment', '/dropdown'])
+
+    def test_cache(self):
+        self.assertEqual(self.texts('drop'), self.texts('Drop'))
+        self.assertEqual(len(self.autocomplete._cache), 1)
+        self.texts('drop', limit=1)
+        self.assertEqual(len(self.autocomplete._cache), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import threading
+import time
+import unittest
+
+from tutorial.utils.cache import LRUCache
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class LRUCacheTests(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_ttl(self):
+        clock = Clock()
+        cache = LRUCache(maxsize=2, ttl=10, timer=clock)
+        cache.set('a', 1)
+        clock.now = 9
+        self.assertEqual(cache.get('a'), 1)
+        clock.now = 10
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('a', 'default'), 'default')
+
+    def test_get_or_set(self):
+        cache = LRUCache()
+        calls = []
+
+        def build():
+            calls.append(1)
+            return 'value'
+
+        self.assertEqual(cache.get_or_set('key', build), 'value')
+        self.assertEqual(cache.get_or_set('key', build), 'value')
+        self.assertEqual(len(calls), 1)
+
+    def test_get_or_set_builds_once(self):
+        cache = LRUCache()
+        calls = []
+
+        def build():
+            calls.append(1)
+            time.sleep(0.05)
+            return 'value'
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.get_or_set('key', build)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['value'] * 4)
+        self.assertEqual(len(calls), 1)
+
+    def test_get_or_set_retries_failures(self):
+        cache = LRUCache()
+
+        def fail():
+            raise ValueError
+
+        self.assertRaises(ValueError, cache.get_or_set, 'key', fail)
+        self.assertEqual(cache.get_or_set('key', lambda: 'value'), 'value')
+
+    def test_falsy_values_are_cached(self):
+        cache = LRUCache()
+        cache.set('key', None)
+        self.assertIn('key', cache)
+        self.assertIsNone(cache.get_or_set('key', lambda: 'other'))
@@ -0,0 +1,53 @@
+import unittest
+from datetime import datetime
+
+import dash_core_components as dcc
+
+from tutorial.utils.component_block import ComponentBlock
+
+
+def example(snippet):
+    # the component that the block renders below its source
+    return ComponentBlock(snippet).children[1].children
+
+
+class ComponentBlockTests(unittest.TestCase):
+    def test_literal_call(self):
+        snippet = '''import dash_core_components as dcc
+from datetime import datetime as dt
+
+dcc.DatePickerSingle(
+    id='date',
+    min_date_allowed=dt(1995, 8, 5),
+    first_day_of_week=3,
+    clearable=True
+)'''
+        self.assertEqual(
+            example(snippet).to_plotly_json(),
+            dcc.DatePickerSingle(
+                id='date',
+                min_date_allowed=datetime(1995, 8, 5),
+                first_day_of_week=3,
+                clearable=True
+            ).to_plotly_json()
+        )
+
+    def test_other_snippets_are_executed(self):
+        snippet = '''import dash_core_components as dcc
+
+dcc.Slider(marks={i: str(i) for i in range(3)})'''
+        self.assertEqual(example(snippet).marks, {0: '0', 1: '1', 2: '2'})
+
+    def test_only_dcc_is_imported(self):
+        # anything else is executed as is, where dcc isn't imported
+        with self.assertRaises(NameError):
+            example('import os\n\ndcc.Input(value=1)')
+
+    def test_copies(self):
+        snippet = 'import dash_core_components as dcc\n\ndcc.Input(value=1)'
+        first = example(snippet)
+        first.id = 'changed'
+        second = example(snippet)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.to_plotly_json(),
+                         dcc.Input(value=1).to_plotly_json())
@@ -0,0 +1,49 @@
+import unittest
+
+import dash_core_components as dcc
+import dash_html_components as html
+
+from tutorial.utils.component_tree import component_ids, replace, walk
+
+
+class ComponentTreeTests(unittest.TestCase):
+    def setUp(self):
+        self.tree = html.Div([
+            html.H1('Title', id='title'),
+            html.Div(dcc.Link('Home', href='/', id='link')),
+            'text',
+            [html.P(id='nested')]
+        ], id='root')
+
+    def test_walk(self):
+        self.assertEqual(
+            [getattr(c, 'id', None) for c in walk(self.tree)],
+            ['root', 'title', None, 'link', 'nested']
+        )
+
+    def test_component_ids(self):
+        self.assertEqual(component_ids([self.tree, html.Div(id='other')]),
+                         set(['root', 'title', 'link', 'nested', 'other']))
+
+    def test_replace(self):
+        def link_to_a(component):
+            if component._type == 'Link':
+                return html.A(component.children, href=component.href)
+            return component
+
+        tree = replace(self.tree, link_to_a)
+        self.assertEqual(tree.children[1].children._type, 'A')
+        self.assertEqual(tree.children[1].children.href, '/')
+        self.assertEqual(tree.children[2], 'text')
+
+    def test_replace_copies(self):
+        def prefix(component):
+            if getattr(component, 'id', None) is not None:
+                component.id = 'prefix-' + component.id
+            return component
+
+        shared = html.Div((html.P('text', id='p'),))
+        tree = replace(html.Div([shared]), prefix)
+        self.assertEqual(tree.children[0].children[0].id, 'prefix-p')
+        self.assertIsInstance(tree.children[0].children, tuple)
+        self.assertEqual(shared.children[0].id, 'p')
@@ -0,0 +1,84 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from tutorial.utils.index_sync import FileBackend, diff, record_hash, sync
+
+
+class RecordingBackend(FileBackend):
+    def __init__(self, path):
+        super(RecordingBackend, self).__init__(path)
+        self.calls = []
+
+    def save(self, records):
+        self.calls.append(('save', [r['objectID'] for r in records]))
+        super(RecordingBackend, self).save(records)
+
+    def delete(self, object_ids):
+        self.calls.append(('delete', list(object_ids)))
+        super(RecordingBackend, self).delete(object_ids)
+
+
+def record(object_id, content='text'):
+    return {'objectID': object_id, 'content': content}
+
+
+class IndexSyncTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.manifest = os.path.join(self.directory, 'manifest.json')
+        self.backend = RecordingBackend(
+            os.path.join(self.directory, 'index.json'))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def sync(self, records, **kwargs):
+        self.backend.calls = []
+        return sync(self.backend, records, self.manifest, **kwargs)
+
+    def test_diff(self):
+        hashes = {'a': record_hash(record('a')), 'b': 'old', 'c': None}
+        added, updated, deleted = diff(
+            [record('a'), record('b'), record('d')], hashes)
+        self.assertEqual(added, [record('d')])
+        self.assertEqual(updated, [record('b')])
+        self.assertEqual(deleted, ['c'])
+
+    def test_sync(self):
+        self.sync([record('a'), record('b'), record('c')])
+        self.assertEqual(self.backend.calls, [('save', ['a', 'b', 'c'])])
+
+        # nothing changed
+        self.assertEqual(
+            self.sync([record('a'), record('b'), record('c')]), ([], [], []))
+        self.assertEqual(self.backend.calls, [])
+
+        self.sync([record('a'), record('b', 'new text'), record('d')])
+        self.assertEqual(self.backend.calls, [
+            ('save', ['d', 'b']), ('delete', ['c'])])
+        self.assertEqual(self.backend.records(), {
+            'a': record('a'), 'b': record('b', 'new text'), 'd': record('d')})
+
+    def test_batches(self):
+        self.sync([record(str(i)) for i in range(5)], batch_size=2)
+        self.assertEqual(self.backend.calls, [
+            ('save', ['0', '1']), ('save', ['2', '3']), ('save', ['4'])])
+
+    def test_without_manifest(self):
+        self.backend.save([record('stale'), record('a')])
+        self.sync([record('a'), record('b')])
+        # without a manifest every record is saved and the records that
+        # the backend has but shouldn't are deleted
+        self.assertEqual(self.backend.calls, [
+            ('save', ['b', 'a']), ('delete', ['stale'])])
+
+        # the manifest is only valid for the backend that it was written for
+        other = FileBackend(os.path.join(self.directory, 'other.json'))
+        self.assertEqual(
+            sync(other, [record('a')], self.manifest), ([record('a')], [], []))
+
+    def test_unique_ids(self):
+        with self.assertRaises(ValueError):
+            self.sync([record('a'), record('a')])
@@ -0,0 +1,59 @@
+import unittest
+
+import dash_core_components as dcc
+import dash_html_components as html
+
+from tutorial.utils.component_json import to_json
+from tutorial.utils.interning import InternTable
+
+
+def row(name):
+    return html.Tr([html.Td(name), html.Td(dcc.Markdown('A *prop*'))])
+
+
+class InternTableTests(unittest.TestCase):
+    def test_shares_equal_subtrees(self):
+        table = InternTable()
+        tree = html.Table([row('a'), row('a'), row('b')])
+        serialized = to_json(tree)
+
+        self.assertIs(table.intern(tree), tree)
+        self.assertEqual(to_json(tree), serialized)
+        self.assertIs(tree.children[0], tree.children[1])
+        self.assertIsNot(tree.children[0], tree.children[2])
+        self.assertIs(tree.children[0].children[1],
+                      tree.children[2].children[1])
+
+    def test_shares_between_trees(self):
+        table = InternTable()
+        first = table.intern(html.Div([html.Hr(), row('a')]))
+        second = table.intern(html.Div([html.Hr(), row('a')]))
+        self.assertIs(first, second)
+        # Div, Hr, Tr, both Tds and the Markdown
+        self.assertEqual(len(table), 6)
+        self.assertEqual(table.shared, 6)
+
+    def test_props_are_compared(self):
+        table = InternTable()
+        tree = table.intern([
+            html.Div('text', className='a'),
+            html.Div('text', className='b'),
+            html.Div('text', style={'color': 'red'}),
+            html.Div(['text']),
+        ])
+        self.assertEqual(len(set(id(node) for node in tree)), 4)
+
+    def test_components_with_ids_are_not_shared(self):
+        table = InternTable()
+        tree = table.intern([
+            html.Div(row('a'), id='first'),
+            html.Div(row('a'), id='second'),
+        ])
+        self.assertIsNot(tree[0], tree[1])
+        self.assertIs(tree[0].children, tree[1].children)
+
+        tree = table.intern([
+            html.Div(html.Span(id='span')),
+            html.Div(html.Span(id='span')),
+        ])
+        self.assertIsNot(tree[0], tree[1])
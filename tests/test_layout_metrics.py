@@ -0,0 +1,58 @@
+import unittest
+
+import dash_core_components as dcc
+import dash_html_components as html
+
+from tutorial.utils.component_json import to_json
+from tutorial.utils.layout_metrics import measure, over_budget, subtrees
+
+
+def section(title):
+    return html.Div(className='section', children=[
+        html.H3(title),
+        dcc.Markdown('A paragraph that is long enough to be worth counting ' * 5)
+    ])
+
+
+class LayoutMetricsTests(unittest.TestCase):
+    def test_subtrees(self):
+        tree = html.Div(id='root', children=[
+            html.H1('title'),
+            [html.P(html.Span('nested'))]
+        ])
+        self.assertEqual(
+            [(path, depth) for _, path, depth in subtrees(tree)],
+            [(('Div#root',), 1),
+             (('Div#root', 'H1[0]'), 2),
+             (('Div#root', 'P[0]'), 2),
+             (('Div#root', 'P[0]', 'Span'), 3)]
+        )
+
+    def test_measure(self):
+        tree = html.Div([section('a'), section('b'), html.Hr()])
+        metrics = measure(tree)
+        self.assertEqual(metrics['bytes'], len(to_json(tree)))
+        self.assertEqual(metrics['nodes'], 8)
+        self.assertEqual(metrics['depth'], 3)
+        self.assertEqual(metrics['largest'][0][1], ('Div', 'Div[0]'))
+
+    def test_duplicates(self):
+        tree = html.Div([
+            html.Div(section('a')), html.Div(section('a')), section('b')])
+        duplicates = measure(tree)['duplicates']
+        # the sections are only repeated because their parents are, and the
+        # Markdown of all three is the same
+        self.assertEqual(
+            [(copies, path) for _, copies, _, path in duplicates],
+            [(3, ('Div', 'Div[0]', 'Div', 'Markdown[1]')),
+             (2, ('Div', 'Div[0]'))]
+        )
+        wasted, copies, size, _ = duplicates[1]
+        self.assertEqual(wasted, size)
+
+    def test_over_budget(self):
+        metrics = {'bytes': 100, 'nodes': 10, 'depth': 3}
+        self.assertEqual(
+            over_budget(metrics, {'bytes': 50, 'nodes': 10, 'depth': None}),
+            [('bytes', 100, 50)])
+        self.assertEqual(over_budget(metrics, {}), [])
@@ -0,0 +1,69 @@
+import copy
+import unittest
+
+import dash_core_components as dcc
+import dash_html_components as html
+from dash.dependencies import Event, Input, Output, State
+
+from tutorial.utils.namespaces import (
+    namespace_dependency, namespace_id, namespace_ids)
+
+
+class NamespaceTests(unittest.TestCase):
+    def test_namespace_id(self):
+        component_id = namespace_id('example', 'graph')
+        self.assertEqual(component_id, 'example-graph')
+        self.assertEqual(component_id.original, 'graph')
+        self.assertIs(namespace_id('example', component_id), component_id)
+        # ids that happen to start with the namespace are still prefixed
+        self.assertEqual(namespace_id('example', 'example-graph'),
+                         'example-example-graph')
+        self.assertEqual(copy.deepcopy(component_id).original, 'graph')
+
+    def test_namespace_ids(self):
+        tree = html.Div(id='page', children=[
+            dcc.Graph(id='graph'),
+            html.Div([html.Span('text'), dcc.Input(id='input')]),
+        ])
+        tree = namespace_ids('example', tree)
+        self.assertEqual(tree.id, 'example-page')
+        self.assertEqual(tree.children[0].id, 'example-graph')
+        self.assertEqual(tree.children[1].children[1].id, 'example-input')
+        self.assertFalse(hasattr(tree.children[1], 'id'))
+        self.assertEqual(getattr(tree, 'data-id'), 'page')
+        self.assertFalse(hasattr(tree.children[0], 'data-id'))
+
+        # namespacing the same tree again doesn't prefix the ids twice
+        tree = namespace_ids('example', tree)
+        self.assertEqual(tree.children[0].id, 'example-graph')
+
+    def test_namespace_label(self):
+        tree = namespace_ids('example', html.Div([
+            html.Label('Name', htmlFor='name'),
+            dcc.Input(id='name'),
+        ]))
+        self.assertEqual(tree.children[0].htmlFor, tree.children[1].id)
+        self.assertFalse(hasattr(tree.children[0], 'id'))
+
+        tree = namespace_ids('example', tree)
+        self.assertEqual(tree.children[0].htmlFor, 'example-name')
+
+    def test_namespace_ids_of_values(self):
+        self.assertEqual(namespace_ids('example', 'text'), 'text')
+        self.assertEqual(namespace_ids('example', None), None)
+        self.assertEqual(
+            namespace_ids('example', [html.Div(id='a'), 1])[0].id,
+            'example-a')
+
+    def test_namespace_dependency(self):
+        for dependency in [Input('graph', 'clickData'),
+                           Output('graph', 'figure'),
+                           State('graph', 'figure'),
+                           Event('interval', 'interval')]:
+            namespaced = namespace_dependency('example', dependency)
+            self.assertIs(type(namespaced), type(dependency))
+            self.assertEqual(
+                namespaced.component_id,
+                'example-' + dependency.component_id)
+            # the original is left alone
+            self.assertFalse(dependency.component_id.startswith('example'))
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+import dash_core_components as dcc
+import dash_html_components as html
+
+from tutorial.utils.prerender import render
+
+
+class RenderTests(unittest.TestCase):
+    def test_html_components(self):
+        self.assertEqual(
+            render(html.Div([
+                html.H1('Title <1>'),
+                html.Img(src='logo.svg'),
+                html.A('link', href='/', className='link', n_clicks=0)
+            ], id='root', style={'marginTop': 10, 'opacity': 0.5})),
+            '<div id="root" style="margin-top: 10px; opacity: 0.5">'
+            '<h1>Title &lt;1&gt;</h1><img src="logo.svg">'
+            '<a class="link" href="/">link</a></div>'
+        )
+
+    def test_core_components(self):
+        self.assertEqual(
+            render([
+                dcc.Markdown('# Montréal'),
+                dcc.SyntaxHighlighter('x < 1', language='python'),
+                dcc.Link('home', href='/'),
+                dcc.Graph(id='graph')
+            ]),
+            u'<div><h1>Montréal</h1></div>'
+            '<pre><code class="language-python">x &lt; 1</code></pre>'
+            '<a href="/">home</a><div id="graph"></div>'
+        )
+
+    def test_children_by_id(self):
+        self.assertEqual(
+            render(html.Div(html.Div(id='chapter')),
+                   {'chapter': html.P('content')}),
+            '<div><div id="chapter"><p>content</p></div></div>'
+        )
+
+    def test_markdown_lines(self):
+        self.assertEqual(
+            render(dcc.Markdown(['- one', '- two'])),
+            '<div><ul>\n<li>one</li>\n<li>two</li>\n</ul></div>'
+        )
+
+    def test_skip(self):
+        self.assertEqual(
+            render(html.Div([html.Div(id='wait-for-layout'), 'text']),
+                   skip=lambda component_id: component_id.startswith('wait')),
+            '<div>text</div>'
+        )
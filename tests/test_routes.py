@@ -0,0 +1,55 @@
+import unittest
+
+from tutorial.utils.routes import RouteTable, normalize_pathname
+
+
+class RouteTableTests(unittest.TestCase):
+    def setUp(self):
+        self.routes = RouteTable({
+            'index': {'url': '/'},
+            'dash-core-components': {'url': '/dash-core-components'},
+            'dropdown-examples': {'url': '/dash-core-components/dropdown'},
+            'deployment': {'url': '/deployment'},
+            'deployment-onpremise': {'url': '/deployment/on-premise'},
+        })
+
+    def test_normalize_pathname(self):
+        self.assertEqual(normalize_pathname('/'), '/')
+        self.assertEqual(normalize_pathname('//'), '/')
+        self.assertEqual(normalize_pathname('/urls/'), '/urls')
+        self.assertEqual(normalize_pathname('/urls//'), '/urls')
+        self.assertEqual(normalize_pathname('urls'), '/urls')
+        self.assertEqual(normalize_pathname('/urls?a=1#top'), '/urls')
+        self.assertIsNone(normalize_pathname(None))
+
+    def test_exact_match(self):
+        self.assertEqual(self.routes.resolve('/'), 'index')
+        self.assertEqual(self.routes.resolve('/deployment'), 'deployment')
+        self.assertEqual(
+            self.routes.resolve('/dash-core-components/dropdown'),
+            'dropdown-examples')
+
+    def test_trailing_slash(self):
+        self.assertEqual(
+            self.routes.resolve('/dash-core-components/dropdown/'),
+            'dropdown-examples')
+        self.assertEqual(
+            self.routes.resolve('/deployment/on-premise/'),
+            'deployment-onpremise')
+
+    def test_prefix_fallback(self):
+        self.assertEqual(
+            self.routes.resolve('/dash-core-components/unknown'),
+            'dash-core-components')
+        self.assertEqual(
+            self.routes.resolve('/dash-core-components/dropdown/extra/'),
+            'dropdown-examples')
+
+    def test_unknown_routes_use_default(self):
+        self.assertEqual(self.routes.resolve('/unknown'), 'index')
+        self.assertEqual(self.routes.resolve('/unknown/nested'), 'index')
+        self.assertIsNone(self.routes.resolve(None))
+
+    def test_duplicate_urls(self):
+        with self.assertRaises(Exception):
+            RouteTable({'a': {'url': '/a'}, 'b': {'url': '/a/'}})
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+import dash_core_components as dcc
+import dash_html_components as html
+
+from tutorial.utils.search import SearchIndex, text, tokenize
+
+DOCUMENTS = [
+    {'url': '/dropdown', 'name': 'Dropdown',
+     'description': 'A dropdown component',
+     'content': 'Select one or more options from a dropdown menu.'},
+    {'url': '/graph', 'name': 'Graph',
+     'description': 'Interactive graphs',
+     'content': 'Graphs respond to hover and click events. ' * 5 +
+                'A dropdown can filter the graph.'},
+    {'url': '/deployment', 'name': 'Deployment',
+     'description': '',
+     'content': 'Deploy the app to Heroku.'},
+]
+
+
+class SearchTests(unittest.TestCase):
+    def setUp(self):
+        self.index = SearchIndex(DOCUMENTS)
+
+    def urls(self, query):
+        return [hit['url'] for hit in self.index.search(query)]
+
+    def test_tokenize(self):
+        self.assertEqual(
+            list(tokenize(u'dcc.Dropdown, café')),
+            [('dcc', 0, 3), ('dropdown', 4, 12), (u'café', 14, 18)])
+
+    def test_ranking(self):
+        self.assertEqual(self.urls('dropdown'), ['/dropdown', '/graph'])
+        self.assertEqual(self.urls('graph dropdown'), ['/graph', '/dropdown'])
+        self.assertEqual(self.urls('heroku'), ['/deployment'])
+        self.assertEqual(self.urls('missing'), [])
+        self.assertEqual(self.urls(' '), [])
+
+    def test_prefix(self):
+        self.assertEqual(self.urls('depl'), ['/deployment'])
+        # only the last term is a prefix
+        self.assertEqual(self.urls('depl app'), ['/deployment'])
+        self.assertEqual(self.index.expand('grap'), ['graph', 'graphs'])
+
+    def test_limit(self):
+        self.assertEqual(len(self.index.search('a', limit=1)), 1)
+
+    def test_highlights(self):
+        hit = self.index.search('dropdown')[1]
+        self.assertEqual(hit['url'], '/graph')
+        self.assertNotIn('content', hit)
+        self.assertEqual(
+            hit['highlights'], {'name': [], 'section': [], 'description': []})
+        snippet = hit['snippet']
+        self.assertEqual(len(snippet['highlights']), 1)
+        start, end = snippet['highlights'][0]
+        self.assertEqual(snippet['text'][start:end], 'dropdown')
+
+        hit = self.index.search('dropdown')[0]
+        self.assertEqual(hit['highlights']['name'], [(0, 8)])
+        self.assertEqual(hit['highlights']['description'], [(2, 10)])
+
+    def test_text(self):
+        tree = html.Div([
+            html.H1('Title'),
+            dcc.Markdown('Some *markdown*'),
+            html.Div([' ', html.Code(u'caf\xe9'.encode('utf-8'))]),
+            dcc.Graph(id='graph')
+        ])
+        self.assertEqual(text(tree), u'Title\nSome *markdown*\ncaf\xe9')
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+import dash_core_components as dcc
+import dash_html_components as html
+
+from tutorial.utils.text_records import TextRecord, flatten, text_records
+
+
+class TextRecordsTests(unittest.TestCase):
+    def test_flatten(self):
+        self.assertEqual(
+            flatten(html.P(['Use ', html.Code('dcc.Graph'), ' here'])),
+            'Use dcc.Graph here')
+
+    def test_records(self):
+        tree = html.Div([
+            html.H1('Dropdown'),
+            html.P(['A ', html.Strong('dropdown'), ' component.']),
+            html.Div([
+                'Some text',
+                html.H2(['Multi-', html.Em('value')], id='multi'),
+                dcc.SyntaxHighlighter('dcc.Dropdown(multi=True)'),
+            ]),
+            html.H2('Props'),
+            html.Table([
+                html.Tr([html.Th('Attribute'), html.Th('Description')]),
+                html.Tr([html.Td(dcc.Markdown('id')),
+                         html.Td(dcc.Markdown('The ID'))]),
+                html.Tr([html.Td(dcc.Markdown('multi')),
+                         html.Td(dcc.Markdown(''))]),
+            ]),
+            dcc.Graph(id='graph'),
+        ])
+        self.assertEqual(list(text_records(tree)), [
+            TextRecord('heading', 'Dropdown', ('Dropdown',), None),
+            TextRecord('paragraph', 'A dropdown component.', ('Dropdown',),
+                       None),
+            TextRecord('paragraph', 'Some text', ('Dropdown',), None),
+            TextRecord('heading', 'Multi-value', ('Dropdown', 'Multi-value'),
+                       'multi'),
+            TextRecord('code', 'dcc.Dropdown(multi=True)',
+                       ('Dropdown', 'Multi-value'), 'multi'),
+            TextRecord('heading', 'Props', ('Dropdown', 'Props'), None),
+            TextRecord('row', 'id | The ID', ('Dropdown', 'Props'), None),
+            TextRecord('row', 'multi', ('Dropdown', 'Props'), None),
+        ])
+
+    def test_interleaved_inline_and_blocks(self):
+        tree = html.Div([
+            'Before ', html.Code('a'),
+            html.Div('Block'),
+            'after', html.Br(), ' the block',
+            html.H2('Title'),
+            'End',
+        ])
+        self.assertEqual(
+            [(record.kind, record.text) for record in text_records(tree)], [
+                ('paragraph', 'Before a'),
+                ('paragraph', 'Block'),
+                ('paragraph', 'after the block'),
+                ('heading', 'Title'),
+                ('paragraph', 'End'),
+            ])
+
+    def test_markdown(self):
+        tree = dcc.Markdown('''
+        # Title
+
+        Intro
+
+        ```python
+        # not a heading
+        app.layout = html.Div()
+        ```
+
+        ### Details ###
+        More
+        ## Summary
+        ''')
+        self.assertEqual(list(text_records(tree)), [
+            TextRecord('heading', 'Title', ('Title',), None),
+            TextRecord('markdown', 'Intro', ('Title',), None),
+            TextRecord('code', '# not a heading\napp.layout = html.Div()',
+                       ('Title',), None),
+            TextRecord('heading', 'Details', ('Title', 'Details'), None),
+            TextRecord('markdown', 'More', ('Title', 'Details'), None),
+            TextRecord('heading', 'Summary', ('Title', 'Summary'), None),
+        ])
+
+    def test_markdown_anchor(self):
+        # the id of a Markdown component is the anchor of the heading that
+        # it starts with
+        records = list(text_records(html.Div([
+            dcc.Markdown('\n## Usage\nText\n#### Notes\nMore', id='usage'),
+            dcc.Markdown('Text\n## Other', id='other'),
+        ])))
+        self.assertEqual(
+            [(record.text, record.anchor) for record in records],
+            [('Usage', 'usage'), ('Text', 'usage'), ('Notes', 'usage'),
+             ('More', 'usage'), ('Text', 'usage'), ('Other', None)])
+
+    def test_bytes(self):
+        self.assertEqual(
+            list(text_records(html.P(u'caf\xe9'.encode('utf-8')))),
+            [TextRecord('paragraph', u'caf\xe9', (), None)])
@@ -0,0 +1,86 @@
+/*
+ * Each page only sends the callbacks of its own chapter to the renderer
+ * (see `serve_dependencies` in run.py), but the renderer only requests
+ * them once, when the app is loaded. When the chapter router is called
+ * for another page, the callbacks of that page are requested at the same
+ * time, and replace the renderer's before the new chapter is rendered, so
+ * that links between chapters don't need to load the page again.
+ *
+ * The callbacks are replaced with dash-renderer's own (private)
+ * `dependenciesRequest` and `COMPUTE_GRAPHS` actions, as of the version
+ * pinned in requirements.txt. When its store doesn't hold the state that
+ * they set, the renderer's request is sent without a Referer instead, for
+ * which the server returns every callback, and it's never replaced.
+ */
+(function () {
+    var fetch = window.fetch;
+    if (!fetch) {
+        return;
+    }
+    // the page whose callbacks the renderer has
+    var current = window.location.pathname;
+
+    function replaceable() {
+        var state = window.store && window.store.getState();
+        return Boolean(state && 'dependenciesRequest' in state &&
+                       'graphs' in state);
+    }
+
+    function routedPathname(url, options) {
+        if (!/_dash-update-component$/.test(url) || !options ||
+                options.method !== 'POST') {
+            return null;
+        }
+        try {
+            var request = JSON.parse(options.body);
+            if (request.output.id === 'chapter') {
+                return request.inputs[0].value;
+            }
+        } catch (e) {}
+        return null;
+    }
+
+    function withoutReferrer(options) {
+        var copy = {referrerPolicy: 'no-referrer'};
+        Object.keys(options || {}).forEach(function (key) {
+            if (key !== 'referrerPolicy') {
+                copy[key] = options[key];
+            }
+        });
+        return copy;
+    }
+
+    window.fetch = function (url, options) {
+        if (typeof url === 'string' && /_dash-dependencies$/.test(url) &&
+                !replaceable()) {
+            return fetch.call(this, url, withoutReferrer(options));
+        }
+        var response = fetch.apply(this, arguments);
+        var pathname = routedPathname(url, options);
+        if (typeof pathname !== 'string' || pathname === current ||
+                !replaceable()) {
+            return response;
+        }
+        var dependencies = fetch(
+            url.replace(/_dash-update-component$/, '_dash-dependencies') +
+                '?pathname=' + encodeURIComponent(pathname),
+            {credentials: 'same-origin'}
+        ).then(function (r) {
+            return r.ok ? r.json() : null;
+        });
+        return Promise.all([response, dependencies]).then(function (r) {
+            if (r[1]) {
+                current = pathname;
+                window.store.dispatch({
+                    type: 'dependenciesRequest',
+                    payload: {status: 200, content: r[1]}
+                });
+                window.store.dispatch({type: 'COMPUTE_GRAPHS', payload: r[1]});
+            }
+            return r[0];
+        }, function () {
+            // keep the callbacks that the renderer has
+            return response;
+        });
+    };
+})();
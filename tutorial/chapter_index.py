@@ -1,26 +1,40 @@
-import auth
-import core_component_examples as examples
-import core_components
-import dash_deployment_server
-import dash_deployment_server_examples as dds_examples
-import deployment
-import external_css_and_js
-import gallery
-import getting_started_part_1
-import getting_started_part_2
-import graphing
-import html_components
-import installation
-import introduction
-import live_updates
-import on_premise_deployment
-import performance
-import plugins
-import search
-import sharing_state
-import state
-import support
-import urls
+import os
+import threading
+import traceback
+
+import tools
+from utils.anchors import add_anchors
+from utils.autocomplete import Autocomplete, Suggestion
+from utils.cache import LRUCache
+from utils.convert_props_to_table import records as prop_tables
+from utils.interning import InternTable
+from utils.lazy import LazyLayout, lazy_layouts, load_layout, warm_up
+from utils.search import SearchIndex, sections
+
+_package = __name__.rpartition('.')[0]
+_directory = os.path.dirname(os.path.abspath(__file__))
+
+# the subtrees that the chapters repeat are shared between all of them
+interned_layouts = InternTable()
+
+# the ids of the app's layout that the chapters are rendered in, which the
+# anchors of the chapters mustn't take; set by run.py
+shell_ids = set()
+
+
+def _prepare_layout(layout):
+    # anchors are added first: headings with an id aren't shared
+    return interned_layouts.intern(add_anchors(layout, taken=shell_ids))
+
+
+def _lazy(module, attribute='layout'):
+    # chapter modules are only imported when their chapter is requested,
+    # see `load` and `warm_up` below
+    if _package:
+        module = '{}.{}'.format(_package, module)
+    return LazyLayout(module, attribute, transform=_prepare_layout,
+                      prepare=lambda layout: _preload_examples([layout]))
+
 
 ## The chapters dict is used to generate the dash-docs search index
 ## If edited, update the search index by running `python dash_search_index.py`
@@ -30,7 +44,7 @@ chapters = {
     ### home.py ###
     'introduction': {
         'url': '/introduction',
-        'content': introduction.layout,
+        'content': _lazy('introduction'),
         'name':'Introduction',
         'description': 'Dash is a productive Python framework for ' \
                        'building web applications written on top of ' \
@@ -39,7 +53,7 @@ chapters = {
 
     'gallery': {
         'url': '/gallery',
-        'content': gallery.layout,
+        'content': _lazy('gallery'),
         'name': 'Dash App Gallery',
         'description': 'Examples of Dash apps including ' \
                        'drill down, stock tickers, streaming, ' \
@@ -48,14 +62,14 @@ chapters = {
 
     'installation': {
         'url': '/installation',
-        'content': installation.layout,
+        'content': _lazy('installation'),
         'name': 'Part 1. Installation',
         'description': 'How to install and upgrade dash libraries with pip.'
     },
 
     'getting-started': {
         'url': '/getting-started',
-        'content': getting_started_part_1.layout,
+        'content': _lazy('getting_started_part_1'),
         'name': 'Part 2. The Dash Layout',
         'description': 'The Dash `layout` describes what your app will ' \
                        'look like and is composed of a set of declarative ' \
@@ -64,7 +78,7 @@ chapters = {
 
     'getting-started-part-2': {
         'url': '/getting-started-part-2',
-        'content': getting_started_part_2.layout,
+        'content': _lazy('getting_started_part_2'),
         'name': 'Part 3. Basic Callbacks',
         'description': "Dash apps are made interactive through Dash " \
                        "Callbacks: Python functions that are " \
@@ -76,7 +90,7 @@ chapters = {
 
     'state': {
         'url': '/state',
-        'content': state.layout,
+        'content': _lazy('state'),
         'name': 'Part 4. Callbacks With State',
         'description': 'Basic callbacks are fired whenever the values ' \
                        'change. Use Dash `State` with Dash `Inputs` to ' \
@@ -87,7 +101,7 @@ chapters = {
 
     'graphing': {
         'url': '/interactive-graphing',
-        'content': graphing.layout,
+        'content': _lazy('graphing'),
         'name': 'Part 5. Interactive Graphing and Crossfiltering',
         'description': 'Bind interactivity to the Dash `Graph` ' \
                        'component whenever you hover, click, or ' \
@@ -96,7 +110,7 @@ chapters = {
 
     'shared-state': {
         'url': '/sharing-data-between-callbacks',
-        'content': sharing_state.layout,
+        'content': _lazy('sharing_state'),
         'name': 'Part 6. Sharing Data Between Callbacks',
         'description': '`global` variables will break your Dash apps. ' \
                        'However, there are other ways to share data ' \
@@ -107,7 +121,7 @@ chapters = {
 
     'dash-core-components': {
         'url': '/dash-core-components',
-        'content': core_components.layout,
+        'content': _lazy('core_components'),
         'name': 'Dash Core Components',
         'description': 'The Dash Core Component library contains a set ' \
                        'of higher-level components like sliders, graphs, ' \
@@ -117,8 +131,8 @@ chapters = {
     'dash-html-components': {
         'url': '/dash-html-components',
         'content': [
-            html_components.layout,
-            # html_component_appendix.layout,
+            _lazy('html_components'),
+            # _lazy('html_component_appendix'),
         ],
         'name': 'Dash HTML Components',
         'description': 'Dash provides all of the available HTML tags ' \
@@ -130,7 +144,7 @@ chapters = {
 
     'plugins': {
         'url': '/plugins',
-        'content': plugins.layout,
+        'content': _lazy('plugins'),
         'name': 'Build Your Own Components',
         'description': 'Dash components are built with ' \
                        '[React.js](https://reactjs.org/). Dash provides ' \
@@ -140,7 +154,7 @@ chapters = {
 
     'performance': {
         'url': '/performance',
-        'content': performance.layout,
+        'content': _lazy('performance'),
         'name': 'Performance',
         'description': 'There are two main ways to speed up dash apps: '\
                        'caching and using WebGL chart types.'
@@ -148,7 +162,7 @@ chapters = {
 
     'live-updates': {
         'url': '/live-updates',
-        'content': live_updates.layout,
+        'content': _lazy('live_updates'),
         'name': 'Live Updates',
         'description': 'Update your apps on page load or on a predefined ' \
                        'interval (e.g. every 30 seconds).'
@@ -156,7 +170,7 @@ chapters = {
 
     'external': {
         'url': '/external-resources',
-        'content': external_css_and_js.layout,
+        'content': _lazy('external_css_and_js'),
         'name': 'Adding Local CSS & JS and Overriding the Page-Load Template',
         'description': '''
             New in dash v0.22.0! Learn how to add custom CSS and JS to your
@@ -168,7 +182,7 @@ chapters = {
 
     'urls': {
         'url': '/urls',
-        'content': urls.layout,
+        'content': _lazy('urls'),
         'name': 'URL Routing and Multiple Apps',
         'description': 'Dash provides two components (`dcc.Link` and ' \
                        '`dcc.Location`) that allow you to easily make ' \
@@ -178,7 +192,7 @@ chapters = {
 
     'auth': {
         'url': '/authentication',
-        'content': auth.layout,
+        'content': _lazy('auth'),
         'name': 'Authentication',
         'description': 'Authentication for dash apps is provided through a ' \
                        'separate dash-auth package. `dash-auth` provides ' \
@@ -188,7 +202,7 @@ chapters = {
 
     'deployment': {
         'url': '/deployment',
-        'content': deployment.layout,
+        'content': _lazy('deployment'),
         'name': 'Deployment',
         'description': 'To share a Dash app, you need to "deploy" your Dash ' \
                        'app to a server'
@@ -196,7 +210,7 @@ chapters = {
 
     'deployment-onpremise': {
         'url': '/deployment/on-premise',
-        'content': on_premise_deployment.layout,
+        'content': _lazy('on_premise_deployment'),
         'name': 'Deploying Dash Apps on Plotly Enterprise',
         'description': "Plotly Enterprise is Plotly's commercial " \
                        "offering for hosting and sharing Dash apps."
@@ -204,7 +218,7 @@ chapters = {
 
     'dash-deployment-server': {
         'url': '/dash-deployment-server',
-        'content': dash_deployment_server.layout,
+        'content': _lazy('dash_deployment_server'),
         'name': 'Dash Deployment Server Documentation',
         'description': "Dash Deployment Server is Plotly's commercial " \
                        "offering for hosting and sharing Dash apps with " \
@@ -213,7 +227,7 @@ chapters = {
 
     'support': {
         'url': '/support',
-        'content': support.layout,
+        'content': _lazy('support'),
         'name': 'Support and Contact',
         'description': 'More information for Dash demos, Enterprise trials, ' \
                        'Dash workshops, sponsored feature requests and ' \
@@ -224,91 +238,91 @@ chapters = {
 ### Start Components ###
     'dropdown-examples': {
         'url': '/dash-core-components/dropdown',
-        'content': examples.Dropdown,
+        'content': _lazy('core_component_examples', 'Dropdown'),
         'name': 'Dropdowns',
         'description': 'Dropdown examples, properties, and reference.'
     },
 
     'slider-examples': {
         'url': '/dash-core-components/slider',
-        'content': examples.Slider,
+        'content': _lazy('core_component_examples', 'Slider'),
         'name': 'Sliders Component',
         'description': 'Slider examples, properties, and reference.'
     },
 
     'range-slider-examples': {
         'url': '/dash-core-components/rangeslider',
-        'content': examples.RangeSlider,
+        'content': _lazy('core_component_examples', 'RangeSlider'),
         'name': 'Range Slider Component',
         'description': 'Range slider examples, properties, and reference.'
     },
 
     'checklist-examples': {
         'url': '/dash-core-components/checklist',
-        'content': examples.Checklist,
+        'content': _lazy('core_component_examples', 'Checklist'),
         'name': 'Checklist Component',
         'description': 'Checklist examples, properties, and reference.'
     },
 
     'input-examples': {
         'url': '/dash-core-components/input',
-        'content': examples.Input,
+        'content': _lazy('core_component_examples', 'Input'),
         'name': 'Input Component',
         'description': 'Input properties and reference.'
     },
 
     'radio-item-examples': {
         'url': '/dash-core-components/radioitems',
-        'content': examples.RadioItems,
+        'content': _lazy('core_component_examples', 'RadioItems'),
         'name': 'Radio Item Component',
         'description': 'Radio item examples, properties, and reference.'
     },
 
     'datepickersingle-examples': {
         'url': '/dash-core-components/datepickersingle',
-        'content': examples.DatePickerSingle,
+        'content': _lazy('core_component_examples', 'DatePickerSingle'),
         'name': 'Date Picker: Single Component',
         'description': 'Single date picker examples, properties, and reference.'
     },
 
     'datepickerrange-examples': {
         'url': '/dash-core-components/datepickerrange',
-        'content': examples.DatePickerRange,
+        'content': _lazy('core_component_examples', 'DatePickerRange'),
         'name': 'Date Picker: Range Component',
         'description': 'Date range picker examples, properties, and reference.'
     },
 
     'markdown-examples': {
         'url': '/dash-core-components/markdown',
-        'content': examples.Markdown,
+        'content': _lazy('core_component_examples', 'Markdown'),
         'name': 'Markdown Component',
         'description': 'Markdown examples, properties, and reference.'
     },
 
     'link-examples': {
         'url': '/dash-core-components/link',
-        'content': examples.Link,
+        'content': _lazy('core_component_examples', 'Link'),
         'name': 'Link Component',
         'description': 'Link examples, properties, and reference.'
     },
 
     'tabs-example': {
         'url': '/dash-core-components/tabs',
-        'content': examples.Tabs,
+        'content': _lazy('core_component_examples', 'Tabs'),
         'name': 'Tabs & Tab Component',
         'description': 'Tabs examples, properties, and reference.'
     },
 
     'textarea-examples': {
         'url': '/dash-core-components/textarea',
-        'content': examples.Textarea,
+        'content': _lazy('core_component_examples', 'Textarea'),
         'name': 'Text Area Component',
         'description': 'Text area properties and reference.'
     },
 
     'upload-examples': {
         'url': '/dash-core-components/upload',
-        'content': examples.Upload,
+        'content': _lazy('core_component_examples', 'Upload'),
         'name': 'Upload Component',
         'description': 'Upload examples, properties, and reference.'
     },
@@ -316,43 +330,219 @@ chapters = {
 ### Start Dash Deployment Server ###
     'redis-examples': {
         'url': '/dash-deployment-server/redis-database',
-        'content': dds_examples.Redis,
-        'name': 'Text Area Component',
+        'content': _lazy('dash_deployment_server_examples', 'Redis'),
+        'name': 'Linking a Redis Database',
         'description': 'Redis Database.'
     },
 
     'env-var-examples': {
         'url': '/dash-deployment-server/enviornment-variables',
-        'content': dds_examples.EnvVars,
+        'content': _lazy('dash_deployment_server_examples', 'EnvVars'),
         'name': 'Setting Enviornment Variables',
         'description': 'Upload examples, properties, and reference.'
     },
 
     'local-dir-examples': {
         'url': '/dash-deployment-server/map-local-directories',
-        'content': dds_examples.LocalDir,
-        'name': 'Upload Component',
+        'content': _lazy('dash_deployment_server_examples', 'LocalDir'),
+        'name': 'Mapping Local Directories',
         'description': 'Mapping Local Directories'
     },
 ### End Dash Deployment Server ###
     'search': {
         'url': '/search',
-        'content': search.layout,
+        'content': _lazy('search'),
         'name': '',
         'description': 'Search the Dash Docs'
     },
 
     'confirm-examples': {
         'url': '/dash-core-components/confirm',
-        'content': examples.ConfirmDialog,
+        'content': _lazy('core_component_examples', 'ConfirmDialog'),
         'name': 'ConfirmDialog Component',
         'description': 'ConfirmDialog examples, properties, and reference'
     },
 
     'confirm-provider-examples': {
         'url': '/dash-core-components/confirm-provider',
-        'content': examples.ConfirmDialogProvider,
+        'content': _lazy('core_component_examples', 'ConfirmDialogProvider'),
         'name': 'ConfirmDialogProvider Component',
         'description': 'ConfirmDialogProvider examples, properties and reference'
     }
 }
+
+
+def load(key):
+    """
+    Return the content of the chapter `key`, importing its module if needed.
+    """
+    return load_layout(chapters[key]['content'])
+
+
+# the examples that each chapter module loads, by module
+_module_examples = {}
+
+
+def _examples(module, seen=None):
+    # the examples of `module` and of the chapter modules that it imports,
+    # which it loads while it's imported too
+    seen = set() if seen is None else seen
+    name = module.rpartition('.')[2]
+    if name in seen:
+        return []
+    seen.add(name)
+    path = os.path.join(_directory, name + '.py')
+    if not os.path.exists(path):
+        return []
+    if name not in _module_examples:
+        _module_examples[name] = (
+            tools.find_examples(path), tools.find_imports(path))
+    paths, imports = _module_examples[name]
+    return paths + [
+        imported_path for imported in imports
+        for imported_path in _examples(imported, seen)
+    ]
+
+
+def examples(key):
+    """
+    The paths of the examples that the chapter `key` loads.
+    """
+    return [
+        path
+        for layout in lazy_layouts(chapters[key]['content'])
+        for path in _examples(layout.module)
+    ]
+
+
+def _preload_examples(layouts):
+    tools.preload_examples([
+        path for layout in layouts for path in _examples(layout.module)
+    ])
+
+
+def warm_up_chapters(background=True):
+    """
+    Import every chapter module that hasn't been imported yet, running
+    their examples concurrently first.
+    """
+    return warm_up([
+        layout
+        for chapter in chapters.values()
+        for layout in lazy_layouts(chapter['content'])
+    ], background, prepare=_preload_examples)
+
+
+def search_documents():
+    """
+    A search document for every section of every chapter, see
+    `utils.search.sections`. Chapters that fail to load can still be found
+    by their name and description.
+    """
+    warm_up_chapters(background=False)
+    documents = []
+    for key, chapter in sorted(chapters.items()):
+        if key == 'search':
+            continue
+        try:
+            chapter_sections = list(sections(load(key)))
+        except Exception:
+            # warm_up_chapters has printed the error
+            chapter_sections = [(None, None, u'')]
+        for anchor, title, content in chapter_sections:
+            documents.append({
+                'key': key if anchor is None else '{}#{}'.format(key, anchor),
+                'url': (chapter['url'] if anchor is None else
+                        '{}#{}'.format(chapter['url'], anchor)),
+                'name': chapter.get('name', ''),
+                'section': title or '',
+                # the chapter's description is only matched once
+                'description': (
+                    chapter.get('description', '') if anchor is None else ''),
+                'content': content
+            })
+    return documents
+
+
+_search_indexes = LRUCache(maxsize=1)
+
+
+def search_index():
+    """
+    The search index of the chapters, built the first time it's needed.
+    """
+    return _search_indexes.get_or_set(
+        'chapters', lambda: SearchIndex(search_documents()))
+
+
+def warm_up_search_index(background=True):
+    """
+    Build the search index, which loads every chapter first (see
+    `search_documents`), in a daemon thread if `background`. Searches
+    that come in while it's being built wait for it instead of building
+    it again.
+    """
+    def run():
+        try:
+            search_index()
+        except Exception:
+            print('\nError building the search index')
+            traceback.print_exc()
+
+    if not background:
+        run()
+        return None
+    thread = threading.Thread(target=run, name='search-index-warm-up')
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+def _component_urls():
+    # the chapter of each component, by the name of the component
+    return dict(
+        (layout.attribute, chapter['url'])
+        for chapter in chapters.values()
+        for layout in lazy_layouts(chapter['content'])
+        if layout.module.endswith('core_component_examples')
+    )
+
+
+# props that only the renderer sets
+_internal_props = set(['setProps'])
+
+
+def autocomplete_suggestions():
+    """
+    The names of the chapters, of the components in dash_core_components'
+    metadata.json and of their props (other than the internal ones), for
+    `utils.autocomplete`. Components and props link to their component's
+    chapter, or to the chapter about all the components if there isn't one.
+    """
+    suggestions = [
+        Suggestion(chapter['name'], 'chapter', chapter['url'])
+        for key, chapter in sorted(chapters.items())
+        if chapter.get('name')
+    ]
+    component_urls = _component_urls()
+    for name, (_, rows) in sorted(prop_tables.items()):
+        url = component_urls.get(
+            name, chapters['dash-core-components']['url'])
+        suggestions.append(Suggestion(name, 'component', url))
+        suggestions.extend(
+            Suggestion(u'{}.{}'.format(name, row[0]), 'prop', url)
+            for row in rows if row[0] and row[0] not in _internal_props
+        )
+    return suggestions
+
+
+_autocompletes = LRUCache(maxsize=1)
+
+
+def autocomplete():
+    """
+    The completions of the names of the chapters, components and props.
+    Unlike `search_index`, it doesn't need to load the chapters.
+    """
+    return _autocompletes.get_or_set(
+        'chapters', lambda: Autocomplete(autocomplete_suggestions()))
@@ -0,0 +1,164 @@
+"""
+Local mirror of the datasets that the examples read over HTTP.
+
+The examples' `pd.read_csv` calls are run as `datasets.read_csv` (see
+`tools.rewrite_example`), which reads the registered URLs from the mirror
+in `DATASET_DIR` instead of the network. `python tutorial/datasets.py`
+mirrors all of them and fails if any can't be downloaded; it's run by
+bin/post_compile, so deployed apps boot offline. A dataset that isn't
+mirrored yet (e.g. in development) is downloaded once and stored there.
+
+The mirror is content-addressed: `index.json` maps each URL to the sha256
+of its CSV, stored as `<sha256>.csv`. Each CSV is also stored as a pickled
+DataFrame, which is what's loaded on subsequent boots.
+"""
+import hashlib
+import json
+import os
+import sys
+import threading
+
+import pandas as pd
+from six.moves.urllib.request import urlopen
+
+DATASET_DIR = os.environ.get(
+    'DASH_DOCS_DATASET_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'datasets')
+)
+
+DATASETS = [
+    'https://raw.githubusercontent.com/plotly/datasets/master/'
+    'gapminderDataFiveYear.csv',
+
+    'https://raw.githubusercontent.com/plotly/datasets/master/'
+    '1962_2006_walmart_store_openings.csv',
+
+    'https://gist.githubusercontent.com/chriddyp/'
+    'cb5392c35661370d95f300086accea51/raw/'
+    '8e0768211f6b747c0db42a9ce9a0937dafcbd8b2/indicators.csv',
+
+    'https://gist.githubusercontent.com/chriddyp/'
+    'c78bf172206ce24f77d6363a2d754b59/raw/'
+    'c353e8ef842413cae56ae3920b8fd78468aa4cb2/'
+    'usa-agricultural-exports-2011.csv',
+
+    'https://gist.githubusercontent.com/chriddyp/'
+    '5d1ea79569ed194d432e56108a04d188/raw/'
+    'a9f9e8076b837d541398e999dcbac2b2826a81f8/gdp-life-exp-2007.csv',
+]
+
+# guards index.json, which is shared by every dataset
+_index_lock = threading.Lock()
+# a lock for each url, held while its DataFrame is loaded from disk
+_url_locks = {}
+# DataFrames that have already been loaded, by url; callers get a copy
+_frames = {}
+
+
+def _url_lock(url):
+    with _index_lock:
+        return _url_locks.setdefault(url, threading.Lock())
+
+
+def _index_path():
+    return os.path.join(DATASET_DIR, 'index.json')
+
+
+def _read_index():
+    if not os.path.exists(_index_path()):
+        return {}
+    with open(_index_path(), 'r') as f:
+        return json.load(f)
+
+
+def _write(path, data, mode='wb'):
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    with open(tmp_path, mode) as f:
+        f.write(data)
+    os.rename(tmp_path, path)
+
+
+def _pickle_path(digest):
+    # pickles aren't portable between python versions
+    return os.path.join(
+        DATASET_DIR, '{}.py{}.pkl'.format(digest, sys.version_info[0]))
+
+
+def _mirrored_path(url):
+    with _index_lock:
+        index = _read_index()
+    if url in index:
+        path = os.path.join(DATASET_DIR, index[url] + '.csv')
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def mirror(url):
+    """
+    Download `url` into the mirror unless it's already there and return
+    the path of the CSV.
+    """
+    path = _mirrored_path(url)
+    if path is not None:
+        return path
+
+    # no lock is held while downloading: a url that is downloaded twice
+    # concurrently is stored under the same name
+    data = urlopen(url).read()
+    digest = hashlib.sha256(data).hexdigest()
+    with _index_lock:
+        if not os.path.isdir(DATASET_DIR):
+            os.makedirs(DATASET_DIR)
+        path = os.path.join(DATASET_DIR, digest + '.csv')
+        _write(path, data)
+        index = _read_index()
+        index[url] = digest
+        _write(_index_path(), json.dumps(index, indent=4, sort_keys=True),
+               mode='w')
+    return path
+
+
+def load(url):
+    """
+    Return the DataFrame for the registered dataset `url`.
+    """
+    if url not in _frames:
+        path = mirror(url)
+        with _url_lock(url):
+            if url not in _frames:
+                digest = os.path.splitext(os.path.basename(path))[0]
+                if os.path.exists(_pickle_path(digest)):
+                    df = pd.read_pickle(_pickle_path(digest))
+                else:
+                    df = pd.read_csv(path)
+                    try:
+                        df.to_pickle(_pickle_path(digest))
+                    except (IOError, OSError):
+                        pass
+                _frames[url] = df
+    return _frames[url].copy()
+
+
+def read_csv(filepath_or_buffer, *args, **kwargs):
+    """
+    `pandas.read_csv`, except that registered datasets are read from the
+    local mirror.
+    """
+    if filepath_or_buffer not in DATASETS:
+        return pd.read_csv(filepath_or_buffer, *args, **kwargs)
+    if args or kwargs:
+        return pd.read_csv(mirror(filepath_or_buffer), *args, **kwargs)
+    return load(filepath_or_buffer)
+
+
+if __name__ == '__main__':
+    failed = False
+    for dataset_url in DATASETS:
+        try:
+            print('{} -> {}'.format(dataset_url, mirror(dataset_url)))
+        except Exception as e:
+            print('{} failed: {}'.format(dataset_url, e))
+            failed = True
+    if failed:
+        sys.exit(1)
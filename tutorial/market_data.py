@@ -0,0 +1,132 @@
+"""
+Market data for the finance examples.
+
+The examples call `pandas_datareader.data.DataReader` inside their
+callbacks, which `tools.rewrite_example` turns into calls to `DataReader`
+below. It caches results by (ticker, source, start day, end day) and
+fetches them from the provider selected with DASH_DOCS_MARKET_DATA:
+
+- `remote` (default): pandas_datareader, i.e. the live API
+- `fixture`: `<ticker>.csv` files from DASH_DOCS_MARKET_DATA_FIXTURES,
+  falling back to a deterministic synthetic series so the examples also
+  work without network access
+
+`python tutorial/market_data.py` writes the fixtures of `TICKERS` from the
+remote provider.
+"""
+import datetime
+import os
+import sys
+import zlib
+
+import numpy as np
+import pandas as pd
+from pandas_datareader import data as web
+from six import string_types
+
+from utils.cache import LRUCache
+
+FIXTURE_DIR = os.environ.get(
+    'DASH_DOCS_MARKET_DATA_FIXTURES',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                 'examples', 'data', 'market')
+)
+
+# the tickers that the examples request, and the days of their fixtures
+TICKERS = ['AAPL', 'COKE', 'TSLA']
+FIXTURE_START = datetime.date(2017, 1, 1)
+FIXTURE_END = datetime.date(2018, 8, 31)
+
+class RemoteProvider(object):
+    def fetch(self, name, data_source, start, end, **kwargs):
+        return web.DataReader(name, data_source, start, end, **kwargs)
+
+
+class FixtureProvider(object):
+    def __init__(self, directory=FIXTURE_DIR):
+        self.directory = directory
+
+    def fetch(self, name, data_source, start, end, **kwargs):
+        if not isinstance(name, string_types):
+            # like pandas_datareader, several tickers are returned as a
+            # Panel of (field, date, ticker)
+            return pd.Panel(dict(
+                (ticker, self.fetch(ticker, data_source, start, end))
+                for ticker in name
+            )).swapaxes('items', 'minor')
+
+        path = os.path.join(self.directory, '{}.csv'.format(name))
+        if os.path.exists(path):
+            df = pd.read_csv(path, index_col='Date', parse_dates=True)
+            return df[(df.index >= pd.Timestamp(start)) &
+                      (df.index <= pd.Timestamp(end))]
+        return self.synthesize(name, start, end)
+
+    @staticmethod
+    def synthesize(name, start, end):
+        # a random walk seeded by the ticker, so every worker (and every
+        # run) draws the same series for the same ticker
+        index = pd.bdate_range(start, end, name='Date')
+        random = np.random.RandomState(zlib.crc32(name.encode('utf-8')) &
+                                       0xffffffff)
+        close = 50 * np.exp(np.cumsum(random.normal(0, 0.02, len(index))))
+        spread = close * random.uniform(0, 0.03, len(index))
+        return pd.DataFrame({
+            'Open': close + random.uniform(-0.5, 0.5, len(index)) * spread,
+            'High': close + spread,
+            'Low': close - spread,
+            'Close': close,
+            'Volume': random.randint(10 ** 5, 10 ** 7, len(index))
+        }, index=index, columns=['Open', 'High', 'Low', 'Close', 'Volume'])
+
+
+PROVIDERS = {
+    'remote': RemoteProvider,
+    'fixture': FixtureProvider
+}
+
+provider = PROVIDERS[os.environ.get('DASH_DOCS_MARKET_DATA', 'remote')]()
+
+# the examples request data up to `datetime.now()`, so entries are keyed
+# by day and expire after an hour to pick up the latest quotes
+cache = LRUCache(maxsize=256, ttl=60 * 60)
+
+
+def _day(value):
+    if value is None:
+        return None
+    return pd.Timestamp(value).date()
+
+
+def DataReader(name, data_source=None, start=None, end=None, **kwargs):
+    # same defaults as pandas_datareader
+    start = _day(start) or datetime.date(2010, 1, 1)
+    end = _day(end) or datetime.date.today()
+    key = (
+        tuple(name) if isinstance(name, list) else name,
+        data_source, start, end, tuple(sorted(kwargs.items()))
+    )
+    df = cache.get_or_set(
+        key, lambda: provider.fetch(name, data_source, start, end, **kwargs))
+    # callbacks are free to modify the DataFrame that they get
+    return df.copy()
+
+
+def write_fixture(ticker, df, directory=FIXTURE_DIR):
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    df.to_csv(os.path.join(directory, '{}.csv'.format(ticker)),
+              float_format='%.4f', index_label='Date')
+
+
+if __name__ == '__main__':
+    failed = False
+    for fixture_ticker in TICKERS:
+        try:
+            write_fixture(fixture_ticker, RemoteProvider().fetch(
+                fixture_ticker, 'google', FIXTURE_START, FIXTURE_END))
+        except Exception as e:
+            print('{} failed: {}'.format(fixture_ticker, e))
+            failed = True
+    if failed:
+        sys.exit(1)
@@ -1,8 +1,12 @@
+import json
 import time
 import six
 import os
 from datetime import datetime as dt
 
+import flask
+from six.moves.urllib.parse import urlparse
+
 import dash_html_components as html
 import dash_core_components as dcc
 import dash_table_experiments as dt
@@ -10,28 +14,18 @@ import dash_table_experiments as dt
 from dash.dependencies import Input, State, Event, Output
 
 from server import app, server
+from utils.component_tree import component_ids
+from utils.payloads import (
+    MAX_AGE, PayloadCache, cached_callback, conditional)
+from utils.prerender import render
+from utils.routes import RouteTable
+from utils import asset_pipeline
 
-import architecture
-import authentication
-import basic_callbacks
-import callbacks_with_dependencies
-import changelog
 import chapter_index
-import dynamic_content
 import home
-import html_component_appendix
-import open_problems
-
-css = [
-    'https://cdn.rawgit.com/plotly/dash-app-stylesheets/8485c028c19c393e9ab85e1a4fafd78c489609c2/dash-docs-base.css',
-    'https://cdn.rawgit.com/plotly/dash-app-stylesheets/30b641e2e89753b13e6557b9d65649f13ea7c64c/dash-docs-custom.css',
-    'https://fonts.googleapis.com/css?family=Dosis',
-    'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/4.7.0/css/font-awesome.min.css'
-]
-js = ['https://cdn.rawgit.com/chriddyp/ca0d8f02a1659981a0ea7f013a378bbd/raw/e79f3f789517deec58f41251f7dbb6bee72c44ab/plotly_ga.js',
-      'https://cdn.jsdelivr.net/npm/instantsearch.js@2.3/dist/instantsearch.min.js',
-      'https://codepen.io/plotly/pen/ZvPmYv.js'
-]
+import tools
+
+css = asset_pipeline.stylesheets()
 
 def create_contents(contents):
     h = []
@@ -54,6 +48,8 @@ chapters = {
 
 chapters.update(chapter_index.chapters)
 
+routes = RouteTable(chapters)
+
 header = html.Div(
     className='header',
     children=html.Div(
@@ -102,33 +98,190 @@ app.layout = html.Div(
         html.Div(dt.DataTable(rows=[{}]), style={'display': 'none'})
     ]
 )
+chapter_index.shell_ids.update(component_ids(app.layout))
+
+
+# Each page only sends the callbacks of its own chapter to the renderer
+# (see `serve_dependencies`), and assets/page_dependencies.js replaces them
+# when the router is called for another chapter; set
+# DASH_DOCS_SCOPED_DEPENDENCIES=false to send every callback registered so
+# far to every page instead.
+scoped_dependencies = (
+    os.environ.get('DASH_DOCS_SCOPED_DEPENDENCIES', 'true').lower() != 'false')
+
+
+def chapter_content(key):
+    if key == 'index':
+        return chapters['index']['content']
+    return html.Div([
+        html.Div(chapter_index.load(key)),
+        html.Hr(),
+        dcc.Link(html.A('Back to the Table of Contents'), href='/'),
+        html.Div(id='wait-for-page-{}'.format(chapters[key]['url'])),
+    ])
+
+
+# chapter layouts are static after import, so the router's response only
+# depends on the chapter that the pathname resolves to
+chapter_payloads = PayloadCache()
 
 
-@app.callback(Output('chapter', 'children'),
-    [Input('location', 'pathname')])
+@cached_callback(app, Output('chapter', 'children'),
+                 [Input('location', 'pathname')],
+                 key=routes.resolve, cache=chapter_payloads)
 def display_content(pathname):
     if pathname is None:
         return ''
-    if pathname.endswith('/') and pathname != '/':
-        pathname = pathname[:len(pathname) - 1]
-    matched = [c for c in chapters.keys()
-               if chapters[c]['url'] == pathname]
-
-    if matched and matched[0] != 'index':
-        content = html.Div([
-            html.Div(chapters[matched[0]]['content']),
-            html.Hr(),
-            dcc.Link(html.A('Back to the Table of Contents'), href='/'),
-            html.Div(id='wait-for-page-{}'.format(pathname)),
+    return chapter_content(routes.resolve(pathname))
+
+
+# the pre-rendered page for each chapter, embedded in the index so that
+# the chapter shows up before the renderer has loaded; set
+# DASH_DOCS_PRERENDER=false to serve the plain index instead
+prerendered_pages = PayloadCache()
+
+
+def _renderer_marker(component_id):
+    # the integration tests wait for these to know that the renderer has
+    # rendered the layout and the chapter
+    return component_id.startswith('wait-for-')
+
+
+def prerender(pathname):
+    key = routes.resolve(pathname)
+    return prerendered_pages.get(key, lambda: render(
+        app.layout, {'chapter': chapter_content(key)},
+        skip=_renderer_marker))
+
+
+if os.environ.get('DASH_DOCS_PRERENDER', 'true').lower() != 'false':
+    app.prerender = prerender
+
+
+def _page_dependencies(key):
+    """
+    The dependencies of the callbacks that the page of chapter `key` uses:
+    those whose output is in the page's layout, and those that the
+    chapter's examples registered (their outputs may only be created by
+    another callback).
+    """
+    ids = component_ids(app.layout) | component_ids(chapter_content(key))
+    registered = set(
+        callback_id
+        for path in (
+            chapter_index.examples(key) if key in chapter_index.chapters
+            else [])
+        for callback_id in tools.callbacks_by_namespace.get(
+            tools.example_namespace(path), [])
+    )
+    return json.dumps([
+        dependency
+        for dependency in json.loads(app.dependencies().get_data())
+        if dependency['output']['id'] in ids or '{}.{}'.format(
+            dependency['output']['id'],
+            dependency['output']['property']) in registered
+    ])
+
+
+page_dependencies = PayloadCache()
+
+
+def serve_dependencies():
+    # the dependencies of the page `pathname`, when the router is called
+    # for another page, or else of the page that the renderer was loaded
+    # on; only that page's chapter is loaded, the others are loaded in the
+    # background (see `warm_up_search_index` below)
+    pathname = flask.request.args.get('pathname')
+    if pathname is None and flask.request.referrer:
+        pathname = urlparse(flask.request.referrer).path
+    if pathname is None:
+        # no page to scope them to, e.g. the Referer was stripped or the
+        # renderer can't replace its callbacks (see
+        # assets/page_dependencies.js): every callback of every chapter
+        chapter_index.warm_up_chapters(background=False)
+        response = app.dependencies()
+        response.vary.add('Referer')
+        return response
+    key = routes.resolve(pathname)
+    if not scoped_dependencies:
+        # every callback registered so far, which includes the page's
+        chapter_content(key)
+        return app.dependencies()
+    response = flask.Response(
+        page_dependencies.get(key, lambda: _page_dependencies(key)),
+        mimetype='application/json')
+    if 'pathname' not in flask.request.args:
+        response.vary.add('Referer')
+    return response
+
+
+_prefix = app.config['routes_pathname_prefix']
+# the layout and the dependencies only change when the app is deployed, so
+# clients revalidate them with their ETag instead of downloading them again
+server.view_functions['{}_dash-layout'.format(_prefix)] = conditional(
+    server.view_functions['{}_dash-layout'.format(_prefix)])
+server.view_functions['{}_dash-dependencies'.format(_prefix)] = conditional(
+    serve_dependencies)
+
+# the component bundles' urls carry their package version
+_component_suites = (
+    '{}_dash-component-suites/<string:package_name>/<path:path_in_package_dist>'
+).format(_prefix)
+server.view_functions[_component_suites] = conditional(
+    server.view_functions[_component_suites], max_age=365 * 24 * 60 * 60)
+
+
+def serve_search():
+    """
+    The hits for the query `q`, as JSON, see `utils.search.SearchIndex`.
+    `limit` (at most 50) is the number of hits.
+    """
+    try:
+        limit = min(int(flask.request.args.get('limit', 10)), 50)
+    except ValueError:
+        flask.abort(400)
+    query = flask.request.args.get('q', '')
+    return flask.jsonify(
+        query=query,
+        hits=chapter_index.search_index().search(query, limit=limit))
+
+
+# the index only changes when the app is deployed
+server.add_url_rule(
+    '{}_search'.format(_prefix), 'search',
+    conditional(serve_search, max_age=MAX_AGE))
+
+
+def serve_autocomplete():
+    """
+    The completions of the prefix `q`, as JSON, see
+    `utils.autocomplete.Autocomplete`. `limit` (at most 50) is the number
+    of completions.
+    """
+    try:
+        limit = min(int(flask.request.args.get('limit', 10)), 50)
+    except ValueError:
+        flask.abort(400)
+    prefix = flask.request.args.get('q', '')
+    return flask.jsonify(
+        query=prefix,
+        completions=[
+            dict(suggestion._asdict()) for suggestion in
+            chapter_index.autocomplete().complete(prefix, limit=limit)
         ])
-    else:
-        content = chapters['index']['content']
 
-    return content
 
+server.add_url_rule(
+    '{}_autocomplete'.format(_prefix), 'autocomplete',
+    conditional(serve_autocomplete, max_age=MAX_AGE))
 
-app.css.append_css({'external_url': css})
-app.scripts.append_script({'external_url': js})
+# import the chapters and build the search index from them in the
+# background once the server is up (after any fork) so that workers start
+# serving requests right away; set DASH_DOCS_WARM_UP=false to only do it on
+# demand
+if os.environ.get('DASH_DOCS_WARM_UP', 'true').lower() != 'false':
+    server.before_first_request(
+        lambda: chapter_index.warm_up_search_index(background=True))
 
 
 app.index_string = '''
@@ -138,9 +291,10 @@ app.index_string = '''
         {%metas%}
         <title>{%title%}</title>
         {%favicon%}
+        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
         {%css%}
         <!-- Global site tag (gtag.js) - AdWords: 1009791370 -->
-        <script async src=""https://www.googletagmanager.com/gtag/js?id=AW-1009791370""></script>
+        <script async src="https://www.googletagmanager.com/gtag/js?id=AW-1009791370"></script>
         <script>
           window.dataLayer = window.dataLayer || [];
           function gtag(){dataLayer.push(arguments);}
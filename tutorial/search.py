@@ -1,7 +1,9 @@
-import dash
+from dash.dependencies import Input, Output
 import dash_core_components as dcc
 import dash_html_components as html
-import dash_dangerously_set_inner_html
+
+import chapter_index
+from server import app
 
 
 layout = html.Div(style={'padding': 20},
@@ -9,18 +11,59 @@ layout = html.Div(style={'padding': 20},
                             dcc.Input(id='search-input',
                                       placeholder='Search the Dash docs...',
                                       type='text',
-                                      value=''),
-                            html.Div(id='hits',
-                                     children=[html.Div(id='hit-template',
-                                                        style={'display': 'none'},
-                                                        children=[html.H3(html.A('{{{_highlightResult.name.value}}}',
-                                                                                 href='{{permalink}}',
-                                                                                 style={'background-color': '#ffffff',
-                                                                                        'padding-left': '0px'}),
-                                                                          style={'margin-bottom': '1rem'}),
-                                                                  html.P('{{{_highlightResult.description.value}}}')
-                                                        ])
-
-                            ])
-
+                                      value='',
+                                      # see static/autocomplete.js
+                                      list='search-completions'),
+                            html.Div(id='hits')
 ])
+
+
+def highlight(text, highlights):
+    """
+    `text` with the `(start, end)` ranges of `highlights` in `html.Mark`s.
+    """
+    children = []
+    position = 0
+    for start, end in highlights:
+        if start < position:
+            continue
+        children.extend([text[position:start], html.Mark(text[start:end])])
+        position = end
+    children.append(text[position:])
+    return [child for child in children if child != '']
+
+
+def display_hit(hit):
+    title = highlight(hit['name'], hit['highlights']['name'])
+    if hit['section']:
+        title += [u' \u203a '] + highlight(
+            hit['section'], hit['highlights']['section'])
+    children = [
+        # a link that loads the hit's page, which scrolls to the hit's
+        # section
+        html.H3(html.A(title,
+                       href=hit['url'],
+                       style={'background-color': '#ffffff',
+                              'padding-left': '0px'}),
+                style={'margin-bottom': '1rem'}),
+        html.P(highlight(hit['description'],
+                         hit['highlights']['description']))
+    ]
+    snippet = hit['snippet']
+    if snippet['highlights']:
+        children.append(html.P(
+            ['...'] + highlight(snippet['text'], snippet['highlights']) +
+            ['...'],
+            style={'color': '#7f7f7f'}))
+    return html.Div(children)
+
+
+@app.callback(Output('hits', 'children'), [Input('search-input', 'value')])
+def display_hits(query):
+    if not query or not query.strip():
+        return []
+    hits = chapter_index.search_index().search(query)
+    if not hits:
+        return html.P(u'No results for "{}"'.format(query))
+    return [display_hit(hit) for hit in hits]
+
@@ -7,15 +7,105 @@ from flask import Flask, request
 import json
 import plotly.graph_objs as go
 import os
+import traceback
 from flask_cors import CORS
+from six import string_types
+
+from utils import asset_pipeline
+
+
+class DocsCss(dash.resources.Css):
+    """
+    The app's stylesheets, with the ones that only have an external url
+    (e.g. the codepen stylesheets that examples append) kept apart:
+    `serve_locally` drops those, so `DocsDash` links them itself.
+    """
+
+    def __init__(self, layout=None):
+        dash.resources.Css.__init__(self, layout)
+        self.external_urls = []
+
+    def append_css(self, stylesheet):
+        if set(stylesheet) - set(['external_url', 'namespace']):
+            dash.resources.Css.append_css(self, stylesheet)
+            return
+        urls = stylesheet['external_url']
+        for url in [urls] if isinstance(urls, string_types) else urls:
+            if url not in self.external_urls:
+                self.external_urls.append(url)
+
+
+class DocsDash(Dash):
+    """
+    Dash, with per-page assets, the external stylesheets of `DocsCss`
+    linked in its head and the page content pre-rendered into the app
+    entry.
+
+    The bundles that only some pages need (`asset_pipeline.ROUTES`) are
+    added to the index of those pages. `prerender(pathname)` (if set)
+    returns the HTML to show for the requested path while the renderer is
+    loading.
+    """
+    prerender = None
+
+    def __init__(self, *args, **kwargs):
+        super(DocsDash, self).__init__(*args, **kwargs)
+        self.css = DocsCss()
+
+    def _generate_css_dist_html(self):
+        return '\n'.join(
+            [super(DocsDash, self)._generate_css_dist_html()] + [
+                '<link rel="stylesheet" href="{}">'.format(url)
+                for url in self.css.external_urls
+            ])
+
+    def interpolate_index(self, **kwargs):
+        tags = asset_pipeline.route_tags(request.path)
+        for name, extra in [('css', tags['head']),
+                            ('scripts', tags['scripts'])]:
+            if extra:
+                kwargs[name] = '{}\n{}'.format(kwargs.get(name, ''), extra)
+
+        if self.prerender is not None:
+            try:
+                content = self.prerender(request.path)
+            except Exception:
+                # serve the loading placeholder, the renderer will surface
+                # the error when it calls the callbacks
+                traceback.print_exc()
+            else:
+                kwargs['app_entry'] = (
+                    u'<div id="react-entry-point">{}</div>'.format(content)
+                )
+        return super(DocsDash, self).interpolate_index(**kwargs)
+
 
 server = Flask(__name__, static_url_path='/static', static_folder='./static')
 server.secret_key = os.environ.get('secret_key', 'secret')
-app = Dash(
+app = DocsDash(
     __name__,
-    server=server
+    server=server,
+    external_stylesheets=asset_pipeline.stylesheets(),
+    external_scripts=asset_pipeline.scripts()
 )
 
-app.css.config.serve_locally = False
-app.scripts.config.serve_locally = False
+# the component bundles are served by the app too, see run.py. The
+# external stylesheets that examples append are still linked, see `DocsCss`.
+app.css.config.serve_locally = True
+app.scripts.config.serve_locally = True
+
+
+@server.after_request
+def cache_bundles(response):
+    # bundle file names change with their content
+    if (request.path.startswith(asset_pipeline.BUNDLE_URL) and
+            response.status_code == 200):
+        response.headers['Cache-Control'] = (
+            'public, max-age=31536000, immutable')
+    return response
+
+
+# the examples' ids are namespaced (see `tools.ExampleApp`) so they don't
+# collide, but their components are only created when the chapter router
+# returns their chapter, so they aren't in the initial layout
 app.config.suppress_callback_exceptions = True
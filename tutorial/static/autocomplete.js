@@ -0,0 +1,71 @@
+/*
+ * Fill the completions of the search box (see search.py) from the
+ * `_autocomplete` endpoint (see run.py). Its responses are cached by the
+ * browser, so going back to a prefix doesn't call the server again, and
+ * typing doesn't go through the app's callbacks.
+ *
+ * It's only loaded by the search page (see `asset_pipeline.ROUTES`), and
+ * only listens to the app's inputs while it's on that page: its link back
+ * to the table of contents leaves it without loading the page again.
+ */
+(function () {
+    var INPUT_ID = 'search-input';
+    var LIMIT = 10;
+
+    var config = document.getElementById('_dash-config');
+    var prefix = (config &&
+                  JSON.parse(config.textContent).requests_pathname_prefix) ||
+                 '/';
+    var SEARCH_PATHNAME = prefix + 'search';
+    // the query whose completions are shown once they arrive
+    var latest = null;
+
+    function datalist(input) {
+        var id = input.getAttribute('list');
+        var list = document.getElementById(id);
+        if (!list) {
+            list = document.createElement('datalist');
+            list.id = id;
+            document.body.appendChild(list);
+        }
+        return list;
+    }
+
+    function show(input, completions) {
+        var list = datalist(input);
+        while (list.firstChild) {
+            list.removeChild(list.firstChild);
+        }
+        completions.forEach(function (completion) {
+            var option = document.createElement('option');
+            option.value = completion.text;
+            list.appendChild(option);
+        });
+    }
+
+    var entry = document.getElementById('react-entry-point') || document;
+    entry.addEventListener('input', function (event) {
+        var input = event.target;
+        if (window.location.pathname.replace(/\/$/, '') !== SEARCH_PATHNAME ||
+                input.id !== INPUT_ID || !input.getAttribute('list')) {
+            return;
+        }
+        var query = input.value.trim();
+        latest = query;
+        if (!query) {
+            show(input, []);
+            return;
+        }
+        fetch(prefix + '_autocomplete?limit=' + LIMIT + '&q=' +
+              encodeURIComponent(query), {credentials: 'same-origin'})
+            .then(function (response) {
+                return response.ok ? response.json() : null;
+            })
+            .then(function (response) {
+                if (response && query === latest) {
+                    show(input, response.completions);
+                }
+            })
+            .catch(function () {});
+    });
+})();
@@ -1,56 +1,396 @@
+import ast
+import functools
+import hashlib
+import marshal
+import os
+import re
+import tempfile
+import threading
+import time
+import traceback
+
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import dash
+import dash_core_components as dcc
+import dash_html_components as html
+import plotly
+
+import datasets
+import market_data
 from server import app
+from utils.component_json import from_json, to_json
+from utils.namespaces import namespace_dependency, namespace_ids
 
+try:
+    from importlib.util import MAGIC_NUMBER as _MAGIC_NUMBER
+except ImportError:
+    import imp
+    _MAGIC_NUMBER = imp.get_magic()
 
-def load_example(path):
-    with open(path, 'r') as _f:
-        _source = _f.read()
-        _example = _source
-
-        # Use the global app assignment
-        if 'app = dash.Dash' not in _example and 'app = CustomDash()' not in _example:
-            raise Exception("Didn't declare app")
-        _example = _example.replace('app = dash.Dash', '# app = dash.Dash')
-
-        commented_configs = [
-            'app.scripts.config.serve_locally',
-            'app.css.config.serve_locally'
-        ]
-        for config in commented_configs:
-            _example = _example.replace(
-                config,
-                '# {}'.format(config)
-            )
-
-        if 'import dash\n' not in _example:
-            raise Exception("Didn't import dash")
-
-        # return the layout instead of assigning it to the global app
-        if 'app.layout = ' not in _example:
-            raise Exception('app.layout not assigned')
-        _example = _example.replace('app.layout = ', 'layout = ')
-
-        # Remove the "# Run the server" commands
-        if 'app.run_server' not in _example:
-            raise Exception('app.run_server missing')
+# Rewritten and compiled examples are cached on disk, keyed by the hash of
+# their source. Set DASH_DOCS_CACHE_DIR to an empty string to disable.
+CACHE_DIR = os.environ.get(
+    'DASH_DOCS_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+)
+
+# Bump this whenever `rewrite_example` changes to invalidate the cache
+_REWRITE_VERSION = '4'
+
+# cached layouts are rebuilt from JSON with the installed components, so
+# they're invalidated when any of these packages is upgraded
+_PACKAGE_VERSIONS = ' '.join(
+    '{}={}'.format(package.__name__, package.__version__)
+    for package in [dash, dcc, html, plotly]
+)
+
+# Examples that don't touch the app other than to assign their layout and
+# don't read remote data have their layout cached too, so they aren't
+# executed at all when the cache is warm. The cached layout is the JSON that
+# Dash would send, so figures (e.g. `go.Figure`) come back as dicts and
+# tuples as lists.
+_impure_example = re.compile(
+    r'^[^#\n]*('
+    r'\bapp\.(?!layout\b|run_server\b|(css|scripts)\.config\.serve_locally)|'
+    r'read_csv|read_excel|DataReader|get_figure'
+    r')',
+    re.MULTILINE
+)
+
+
+def rewrite_example(source):
+    _example = source
+
+    # Use the global app assignment
+    if 'app = dash.Dash' not in _example and 'app = CustomDash()' not in _example:
+        raise Exception("Didn't declare app")
+    _example = _example.replace('app = dash.Dash', '# app = dash.Dash')
+
+    commented_configs = [
+        'app.scripts.config.serve_locally',
+        'app.css.config.serve_locally'
+    ]
+    for config in commented_configs:
         _example = _example.replace(
-            '\n    app.run_server',
-            'print("Running")\n    # app.run_server'
+            config,
+            '# {}'.format(config)
         )
 
-        scope = {'app': app}
+    if 'import dash\n' not in _example:
+        raise Exception("Didn't import dash")
+
+    # return the layout instead of assigning it to the global app
+    if 'app.layout = ' not in _example:
+        raise Exception('app.layout not assigned')
+    _example = _example.replace('app.layout = ', 'layout = ')
+
+    # read remote datasets from the local mirror, see `datasets`
+    _example = _example.replace('pd.read_csv(', 'datasets.read_csv(')
+    # and their stock quotes through the cached provider, see `market_data`
+    _example = _example.replace('web.DataReader(', 'market_data.DataReader(')
+
+    # the flask-caching examples keep their cache with ours instead of in
+    # the working directory
+    _example = _example.replace(
+        "'CACHE_DIR': 'cache-directory'",
+        "'CACHE_DIR': {!r}".format(os.path.join(
+            CACHE_DIR or tempfile.gettempdir(), 'flask-caching')))
+
+    # Remove the "# Run the server" commands
+    if 'app.run_server' not in _example:
+        raise Exception('app.run_server missing')
+    _example = _example.replace(
+        '\n    app.run_server',
+        'print("Running")\n    # app.run_server'
+    )
+    return _example
+
+
+def _cache_path(path, source, extension):
+    if not CACHE_DIR:
+        return None
+    if not isinstance(source, bytes):
+        source = source.encode('utf-8')
+    digest = hashlib.sha1(
+        _REWRITE_VERSION.encode('utf-8') + _MAGIC_NUMBER +
+        _PACKAGE_VERSIONS.encode('utf-8') + source
+    ).hexdigest()
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(
+        CACHE_DIR, 'examples', '{}-{}.{}'.format(name, digest, extension))
+
+
+def _read_cache(cache_path):
+    if cache_path is None or not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, 'rb') as f:
+            return f.read()
+    except (IOError, OSError):
+        return None
+
+
+def _write_cache(cache_path, data):
+    # the cache is only an optimization, so a read-only or full disk isn't
+    # an error; write to a temporary file first so that concurrent workers
+    # never read a partially written entry
+    if cache_path is None:
+        return
+    try:
+        directory = os.path.dirname(cache_path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        tmp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.rename(tmp_path, cache_path)
+    except (IOError, OSError):
+        pass
+
+
+def compile_example(path, source):
+    """
+    Rewrite and compile the example `source`, using the on-disk cache.
+    """
+    cache_path = _cache_path(path, source, 'code')
+    cached = _read_cache(cache_path)
+    if cached is not None:
         try:
-            exec(_example, scope)
+            return marshal.loads(cached)
+        except (EOFError, ValueError, TypeError):
+            pass
+
+    code = compile(rewrite_example(source), path, 'exec')
+    _write_cache(cache_path, marshal.dumps(code))
+    return code
+
+
+EXAMPLES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'examples')
+
+
+def example_namespace(path):
+    """
+    The prefix of the component ids of the example at `path`, its path
+    relative to the examples directory, e.g. `core_components-dropdown`.
+    Dots would break the `id.property` keys of the callback map.
+    """
+    path = os.path.splitext(os.path.abspath(path))[0]
+    if path.startswith(EXAMPLES_DIR + os.sep):
+        path = path[len(EXAMPLES_DIR + os.sep):]
+    return re.sub(r'[^\w-]+', '-', path).strip('-')
+
+
+class ExampleApp(object):
+    """
+    The `app` that examples are run with: the shared app, except that the
+    ids of the example's components are prefixed with its `namespace`, so
+    that examples that use the same ids (e.g. `url` and `page-content`)
+    can be mounted in the same app without their callbacks replacing each
+    other.
+
+    The ids of the layout are rewritten by `namespace_ids`. The ids of the
+    callbacks' dependencies are rewritten when they're registered and the
+    ids of the components that the callbacks return when they're called.
+    The ids of the callbacks that the example registers are recorded, so
+    that each page only needs to send the callbacks of its own examples.
+    """
+
+    def __init__(self, app, namespace):
+        object.__setattr__(self, '_app', app)
+        object.__setattr__(self, 'namespace', namespace)
+        object.__setattr__(self, 'callbacks', [])
+
+    def __getattr__(self, name):
+        return getattr(self._app, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._app, name, value)
+
+    def _dependency(self, dependency):
+        return namespace_dependency(self.namespace, dependency)
+
+    def callback(self, output, inputs=[], state=[], events=[]):
+        output = self._dependency(output)
+        register = self._app.callback(
+            output,
+            [self._dependency(i) for i in inputs],
+            [self._dependency(s) for s in state],
+            [self._dependency(e) for e in events]
+        )
+        self.callbacks.append(
+            '{}.{}'.format(output.component_id, output.component_property))
+
+        def wrap_func(func):
+            @functools.wraps(func)
+            def namespaced_func(*args, **kwargs):
+                return namespace_ids(self.namespace, func(*args, **kwargs))
+            return register(namespaced_func)
+
+        return wrap_func
+
+
+# a future of the (source, layout) of every example that has been loaded,
+# so that each example is only executed once: the examples preloaded at
+# startup aren't executed again when their chapter imports them, and the
+# chapters that are imported while they're preloaded wait for them.
+# Failures are stored too, since an example that failed half way through
+# may already have registered some of its callbacks.
+_loaded_examples = {}
+_loaded_examples_lock = threading.Lock()
+example_timings = {}
+# the ids of the callbacks that the example of each namespace registered
+callbacks_by_namespace = {}
+
+
+def load_example(path):
+    with _loaded_examples_lock:
+        future = _loaded_examples.get(path)
+        run = future is None
+        if run:
+            future = _loaded_examples[path] = Future()
+    if run:
+        start = time.time()
+        try:
+            future.set_result(_load_example(path))
         except Exception as e:
-            print('\nError running {}\n{}'.format(
-                path,
-                ('======================================' +
-                 '======================================')
-            ))
-            raise e
+            future.set_exception(e)
+        finally:
+            example_timings[path] = time.time() - start
+    return future.result()
+
+
+def _string_values(node):
+    if isinstance(node, ast.Str):
+        return [node.s]
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [n.s for n in node.elts if isinstance(n, ast.Str)]
+    return []
+
+
+def find_examples(module_path):
+    """
+    Return the paths that the module at `module_path` passes to
+    `load_example`, either as a literal or through a comprehension over a
+    literal list, in the order that they appear in its source.
+    """
+    with open(module_path, 'r') as f:
+        tree = ast.parse(f.read(), module_path)
+
+    def is_load_example(node):
+        return isinstance(node, ast.Call) and (
+            getattr(node.func, 'id', None) == 'load_example' or
+            getattr(node.func, 'attr', None) == 'load_example'
+        )
+
+    paths = []
+    for node in ast.walk(tree):
+        if is_load_example(node) and node.args:
+            paths.extend(_string_values(node.args[0]))
+        elif (isinstance(node, (ast.ListComp, ast.GeneratorExp)) and
+              is_load_example(node.elt)):
+            for generator in node.generators:
+                paths.extend(_string_values(generator.iter))
+    return [p for p in paths if p.endswith('.py')]
+
+
+def find_imports(module_path):
+    """
+    Return the names of the modules that the module at `module_path`
+    imports, in the order that they appear in its source.
+    """
+    with open(module_path, 'r') as f:
+        tree = ast.parse(f.read(), module_path)
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.append(node.module)
+    return names
+
+
+def preload_examples(paths, max_workers=8):
+    """
+    Execute the examples in `paths` concurrently, and wait for the ones
+    that are already being executed.
+
+    Most examples spend their time waiting on remote datasets, so they are
+    run in threads. The (source, layout) results are stored and returned
+    by `load_example` when the chapters are imported, which is what keeps
+    the assembled layouts deterministic. Errors are printed here and
+    raised again when their chapter imports them.
+
+    This has to be called outside of any import: Python 2 holds a global
+    import lock while a module is imported, which the examples need.
+    """
+    paths = [
+        p for i, p in enumerate(paths)
+        if (p not in _loaded_examples or not _loaded_examples[p].done()) and
+        p not in paths[:i]
+    ]
+    if not paths:
+        return
+
+    def load(path):
+        try:
+            load_example(path)
+        except Exception:
+            traceback.print_exc()
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        list(executor.map(load, paths))
+    finally:
+        executor.shutdown(wait=True)
+
+
+def timings_report():
+    """
+    The time it took to load each example, slowest first.
+    """
+    return '\n'.join(
+        '{:>8.3f}s  {}'.format(seconds, path) for path, seconds in sorted(
+            example_timings.items(), key=lambda i: i[1], reverse=True)
+    )
+
+
+def _load_example(path):
+    with open(path, 'r') as _f:
+        _source = _f.read()
+
+    layout_cache_path = (
+        None if _impure_example.search(_source) else
+        _cache_path(path, _source, 'json')
+    )
+    namespace = example_namespace(path)
+    cached_layout = _read_cache(layout_cache_path)
+    if cached_layout is not None:
+        return (_source, namespace_ids(
+            namespace, from_json(cached_layout.decode('utf-8'))))
+
+    example_app = ExampleApp(app, namespace)
+    scope = {'app': example_app, 'datasets': datasets,
+             'market_data': market_data}
+    try:
+        exec(compile_example(path, _source), scope)
+    except Exception as e:
+        print('\nError running {}\n{}'.format(
+            path,
+            ('======================================' +
+             '======================================')
+        ))
+        raise e
+
+    callbacks_by_namespace[namespace] = example_app.callbacks
+    if layout_cache_path is not None:
+        _write_cache(layout_cache_path, to_json(scope['layout']).encode('utf-8'))
 
     return (
         _source,
-        scope['layout']      # layout is a global created from the app
+        # layout is a global created from the app
+        namespace_ids(namespace, scope['layout'])
     )
 
 
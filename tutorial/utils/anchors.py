@@ -0,0 +1,121 @@
+"""
+Anchors for the sections of the chapters, so that links (e.g. search hits)
+can point to a section instead of the top of its chapter.
+
+`add_anchors` gives every `html.H2` and `html.H3` without an id an id made
+from its text. `dcc.Markdown` is rendered in the browser, so Markdown that
+has `##` or `###` headings is split into one `dcc.Markdown` per section,
+each with the id of the heading that it starts with. The ids only depend on
+the headings (and the headings before them with the same text), so they
+don't change unless the headings do.
+"""
+import re
+
+import dash_core_components as dcc
+import dash_html_components as html
+from six import string_types
+
+from .component_tree import component_ids, replace
+from .text_records import flatten, markdown_fence, markdown_heading
+
+LEVELS = (2, 3)
+
+_HEADINGS = set('H{}'.format(level) for level in LEVELS)
+_non_word = re.compile(r'[^a-z0-9]+')
+
+
+def slugify(text):
+    return _non_word.sub('-', text.lower()).strip('-') or 'section'
+
+
+class _Slugs(object):
+    """
+    Unique slugs, that aren't any of the ids in `taken`.
+    """
+
+    def __init__(self, taken):
+        self._taken = set(taken)
+
+    def new(self, title):
+        slug = slugify(title)
+        candidate = slug
+        i = 2
+        while candidate in self._taken:
+            candidate = '{}-{}'.format(slug, i)
+            i += 1
+        self._taken.add(candidate)
+        return candidate
+
+
+def split_markdown(source, levels=LEVELS):
+    """
+    Split Markdown `source` before every heading of `levels` that isn't in
+    a code fence, returning the parts as `(title, source)`. The title of
+    the part before the first heading is None.
+    """
+    parts = [(None, [])]
+    fence = None
+    for line in source.split('\n'):
+        fence_match = markdown_fence.match(line)
+        if fence is not None:
+            if fence_match and fence_match.group(1) == fence:
+                fence = None
+        elif fence_match:
+            fence = fence_match.group(1)
+        else:
+            heading = markdown_heading.match(line)
+            if heading and len(heading.group(1)) in levels:
+                parts.append((heading.group(2), []))
+        parts[-1][1].append(line)
+    return [
+        (title, '\n'.join(lines)) for title, lines in parts
+        if title is not None or '\n'.join(lines).strip()
+    ]
+
+
+def _markdown_props(component):
+    return dict(
+        (name, getattr(component, name))
+        for name in component._prop_names
+        if name not in ('id', 'children') and hasattr(component, name)
+    )
+
+
+def add_anchors(tree, taken=()):
+    """
+    A copy of `tree` with anchors added to its sections. The anchors
+    aren't any of the ids in `tree` or in `taken` (e.g. the ids of the
+    layout around `tree`).
+    """
+    slugs = _Slugs(component_ids(tree) | set(taken))
+
+    def anchor(component):
+        if getattr(component, 'id', None) is not None:
+            return component
+        namespace = component._namespace
+        component_type = component._type
+
+        if (namespace == 'dash_html_components' and
+                component_type in _HEADINGS):
+            title = flatten(component).strip()
+            if title:
+                component.id = slugs.new(title)
+            return component
+
+        if (namespace == 'dash_core_components' and
+                component_type == 'Markdown' and
+                isinstance(component.children, string_types)):
+            parts = split_markdown(component.children)
+            if all(title is None for title, _ in parts):
+                return component
+            props = _markdown_props(component)
+            return html.Div([
+                dcc.Markdown(source, **dict(
+                    props, **({} if title is None else
+                              {'id': slugs.new(title)})))
+                for title, source in parts
+            ])
+
+        return component
+
+    return replace(tree, anchor)
@@ -0,0 +1,209 @@
+"""
+Bundle the stylesheets and scripts of the docs into tutorial/static.
+
+`build` reads every source of a bundle (a file in the repo, or a URL that
+is downloaded at build time), concatenates them, minifies stylesheets and
+writes the result as `static/bundles/<name>.<sha1>.<ext>`. The file names
+change with their content, so they're served with immutable cache headers.
+`manifest.json` maps each bundle to its file name.
+
+Bundles listed in `ROUTES` are only loaded by those pages, see
+`route_tags`; the others are loaded by every page. Without a manifest (i.e.
+`build_assets.py` hasn't been run), the original external URLs are used.
+"""
+import hashlib
+import json
+import os
+import re
+
+from six.moves.urllib.request import urlopen
+
+from .routes import normalize_pathname
+
+STATIC_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+BUNDLE_DIR = os.path.join(STATIC_DIR, 'bundles')
+BUNDLE_URL = '/static/bundles/'
+MANIFEST_PATH = os.path.join(BUNDLE_DIR, 'manifest.json')
+
+_repo_dir = os.path.dirname(os.path.dirname(STATIC_DIR))
+
+# name: [(source, external url)], where the source is a path relative to
+# the repo or a URL to download. rawgit is gone, so its files are read from
+# the repo (the docs stylesheets) or from the gist they were served from.
+BUNDLES = {
+    'docs.css': [
+        ('css/base.css',
+         'https://cdn.rawgit.com/plotly/dash-app-stylesheets/'
+         '8485c028c19c393e9ab85e1a4fafd78c489609c2/dash-docs-base.css'),
+        ('css/custom.css',
+         'https://cdn.rawgit.com/plotly/dash-app-stylesheets/'
+         '30b641e2e89753b13e6557b9d65649f13ea7c64c/dash-docs-custom.css'),
+    ],
+    'analytics.js': [
+        ('https://gist.githubusercontent.com/chriddyp/'
+         'ca0d8f02a1659981a0ea7f013a378bbd/raw/'
+         'e79f3f789517deec58f41251f7dbb6bee72c44ab/plotly_ga.js',
+         'https://cdn.rawgit.com/chriddyp/ca0d8f02a1659981a0ea7f013a378bbd/'
+         'raw/e79f3f789517deec58f41251f7dbb6bee72c44ab/plotly_ga.js'),
+    ],
+    'search.js': [
+        ('tutorial/static/autocomplete.js', '/static/autocomplete.js'),
+    ]
+}
+
+# the pages that load a bundle, for bundles that aren't needed everywhere.
+# They're added to the index of those pages, so they're only loaded when
+# the page is loaded directly: the search page is only linked to by the
+# header's plain link, which always loads it.
+ROUTES = {
+    'search.js': ['/search']
+}
+
+# extra attributes of the script tags; scripts that don't render anything
+# shouldn't block the page
+ATTRIBUTES = {
+    'analytics.js': {'async': 'async'},
+    'search.js': {'defer': 'defer'}
+}
+
+# fonts are loaded by these stylesheets from paths relative to them, so
+# they stay on their CDNs
+EXTERNAL_STYLESHEETS = [
+    'https://fonts.googleapis.com/css?family=Dosis',
+    'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/4.7.0/css/'
+    'font-awesome.min.css'
+]
+
+_css_comment = re.compile(r'/\*.*?\*/', re.DOTALL)
+_css_whitespace = re.compile(r'\s+')
+_css_punctuation = re.compile(r'\s*([{};,>])\s*')
+
+
+def minify_css(css):
+    """
+    Strip comments and whitespace. This only handles what our stylesheets
+    use, e.g. it doesn't know about whitespace in strings.
+    """
+    css = _css_comment.sub('', css)
+    css = _css_whitespace.sub(' ', css)
+    css = _css_punctuation.sub(r'\1', css)
+    css = css.replace(': ', ':').replace(';}', '}')
+    return css.strip()
+
+
+def read_source(source):
+    if re.match(r'https?://', source):
+        return urlopen(source).read().decode('utf-8')
+    with open(os.path.join(_repo_dir, source), 'rb') as f:
+        return f.read().decode('utf-8')
+
+
+def build_bundle(name, sources):
+    contents = [read_source(source) for source, _ in sources]
+    if name.endswith('.css'):
+        bundle = '\n'.join(minify_css(c) for c in contents)
+    else:
+        # the scripts are already minified (or tiny); the separator keeps
+        # a script without a trailing semicolon from running into the next
+        bundle = '\n;\n'.join(contents)
+    return bundle.encode('utf-8')
+
+
+def build(bundles=BUNDLES):
+    """
+    Write every bundle and the manifest, returning the manifest.
+    """
+    if not os.path.isdir(BUNDLE_DIR):
+        os.makedirs(BUNDLE_DIR)
+    manifest = {}
+    for name, sources in sorted(bundles.items()):
+        data = build_bundle(name, sources)
+        stem, extension = os.path.splitext(name)
+        filename = '{}.{}{}'.format(
+            stem, hashlib.sha1(data).hexdigest()[:12], extension)
+        with open(os.path.join(BUNDLE_DIR, filename), 'wb') as f:
+            f.write(data)
+        manifest[name] = filename
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, indent=4, sort_keys=True)
+    return manifest
+
+
+def read_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path, 'r') as f:
+            manifest = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    if set(manifest) != set(BUNDLES):
+        return None
+    return manifest
+
+
+manifest = read_manifest()
+
+
+def _bundle_urls(name):
+    if manifest is None:
+        return [url for _, url in BUNDLES[name]]
+    return [BUNDLE_URL + manifest[name]]
+
+
+def _bundles(extension, pathname=None):
+    """
+    The bundles that every page loads, or with `pathname` the bundles that
+    only that page loads.
+    """
+    return [
+        name for name in sorted(BUNDLES)
+        if name.endswith(extension) and (
+            name not in ROUTES if pathname is None else
+            normalize_pathname(pathname) in ROUTES.get(name, []))
+    ]
+
+
+def _scripts(names):
+    return [
+        dict(ATTRIBUTES.get(name, {}), src=url)
+        for name in names for url in _bundle_urls(name)
+    ]
+
+
+def stylesheets():
+    return [
+        url for name in _bundles('.css') for url in _bundle_urls(name)
+    ] + EXTERNAL_STYLESHEETS
+
+
+def scripts():
+    return _scripts(_bundles('.js'))
+
+
+def _tag(name, attributes, closed=True):
+    return '<{}{}>{}'.format(name, ''.join(
+        ' {}="{}"'.format(key, value)
+        for key, value in sorted(attributes.items())
+    ), '</{}>'.format(name) if closed else '')
+
+
+def route_tags(pathname):
+    """
+    The HTML for the bundles that only the page at `pathname` loads:
+    `head` holds their stylesheets and preload hints for their scripts,
+    which are only discovered at the end of the page, `scripts` holds the
+    script tags.
+    """
+    scripts = _scripts(_bundles('.js', pathname))
+    head = [
+        _tag('link', {'rel': 'stylesheet', 'href': url}, closed=False)
+        for name in _bundles('.css', pathname) for url in _bundle_urls(name)
+    ] + [
+        _tag('link', {'rel': 'preload', 'as': 'script',
+                      'href': script['src']}, closed=False)
+        for script in scripts
+    ]
+    return {
+        'head': '\n'.join(head),
+        'scripts': '\n'.join(_tag('script', script) for script in scripts)
+    }
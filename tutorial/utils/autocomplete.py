@@ -0,0 +1,101 @@
+"""
+Completions for what's typed in the search box, from the names of the
+chapters, components and props, answered in process.
+
+A suggestion can be completed from the start of any of its words,
+including the words of camelCase names (so "range" completes
+"DatePickerRange"), ignoring case, spaces and punctuation. Every one of
+those keys is in a sorted array with the index of its suggestion, so the
+keys that start with a prefix are one slice of it, found with bisect. The
+suggestions are sorted by rank, so the best completions are the ones with
+the smallest indexes in that slice. The completions of recent prefixes are
+cached, since everyone types the same first few letters.
+"""
+import heapq
+import re
+from bisect import bisect_left
+from collections import namedtuple
+
+from .cache import LRUCache
+
+# kind: 'chapter', 'component' or 'prop'
+Suggestion = namedtuple('Suggestion', ['text', 'kind', 'url'])
+
+# kinds that are completed first
+KINDS = ('chapter', 'component', 'prop')
+
+# the number of (prefix, limit) whose completions are cached
+CACHE_SIZE = 1024
+
+# the first character of every word, where a word also starts at an
+# uppercase letter that follows a lowercase letter or a digit
+_word_start = re.compile(r'(?<![^\W_])[^\W_]|(?<=[a-z0-9])[A-Z]', re.UNICODE)
+_separators = re.compile(r'[\W_]+', re.UNICODE)
+
+# sorts after every character that a key can have
+_last = u'\uffff'
+
+
+def normalize(text):
+    return _separators.sub(u'', text).lower()
+
+
+def keys(text):
+    """
+    The keys that `text` is completed from: the normalized text from the
+    start of each of its words.
+    """
+    return sorted(set(
+        normalize(text[match.start():])
+        for match in _word_start.finditer(text)
+    ))
+
+
+def _rank(suggestion):
+    return (KINDS.index(suggestion.kind), len(suggestion.text),
+            suggestion.text, suggestion.url)
+
+
+class Autocomplete(object):
+    """
+    Completions of prefixes from `suggestions`, a list of `Suggestion`.
+    Suggestions with the same text are only completed once, as the best
+    ranked of them.
+    """
+
+    def __init__(self, suggestions, cache_size=CACHE_SIZE):
+        self.suggestions = []
+        texts = set()
+        for suggestion in sorted(suggestions, key=_rank):
+            if suggestion.text not in texts:
+                texts.add(suggestion.text)
+                self.suggestions.append(suggestion)
+        entries = sorted(
+            (key, i)
+            for i, suggestion in enumerate(self.suggestions)
+            for key in keys(suggestion.text)
+        )
+        self._keys = [key for key, _ in entries]
+        self._indexes = [i for _, i in entries]
+        self._cache = LRUCache(maxsize=cache_size)
+
+    def __len__(self):
+        return len(self.suggestions)
+
+    def complete(self, prefix, limit=10):
+        """
+        The `limit` best suggestions with a key that starts with `prefix`,
+        best first.
+        """
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        return list(self._cache.get_or_set(
+            (prefix, limit), lambda: self._complete(prefix, limit)))
+
+    def _complete(self, prefix, limit):
+        start = bisect_left(self._keys, prefix)
+        end = bisect_left(self._keys, prefix + _last, start)
+        # a suggestion can have several keys with the prefix
+        indexes = heapq.nsmallest(limit, set(self._indexes[start:end]))
+        return tuple(self.suggestions[i] for i in indexes)
@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import OrderedDict
+
+_missing = object()
+
+
+class LRUCache(object):
+    """
+    A thread-safe dict that holds at most `maxsize` items, evicting the
+    least recently used one first. Items older than `ttl` seconds are
+    treated as missing (no expiry if `ttl` is None).
+    """
+
+    def __init__(self, maxsize=128, ttl=None, timer=time.time):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        # a lock for each key that is being built by `get_or_set`
+        self._building = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return self.get(key, _missing) is not _missing
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._items:
+                return default
+            value, expires = self._items.pop(key)
+            if expires is not None and expires <= self._timer():
+                return default
+            # re-insert to mark the item as the most recently used
+            self._items[key] = (value, expires)
+            return value
+
+    def set(self, key, value):
+        expires = None if self.ttl is None else self._timer() + self.ttl
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = (value, expires)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def get_or_set(self, key, build):
+        """
+        Return the cached value for `key`, calling `build()` to create and
+        cache it if it's missing or expired. Concurrent calls for the same
+        key wait for the one that builds it.
+        """
+        value = self.get(key, _missing)
+        if value is not _missing:
+            return value
+        with self._lock:
+            building = self._building.setdefault(key, threading.Lock())
+        with building:
+            value = self.get(key, _missing)
+            if value is _missing:
+                try:
+                    value = build()
+                    self.set(key, value)
+                finally:
+                    with self._lock:
+                        if self._building.get(key) is building:
+                            del self._building[key]
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
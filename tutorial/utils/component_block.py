@@ -1,10 +1,100 @@
+import ast
+import copy
+import datetime
+import hashlib
+
 import dash_core_components as dcc
 import dash_html_components as html
 
 from tutorial import styles
 
+# evaluated components, by the sha1 of their snippet; callers get a copy
+_components = {}
 
-def ComponentBlock(example_string, **kwargs):
+# names that snippets may import, and that are safe to call with literals
+_importable = {
+    ('dash_core_components', None): dcc,
+    ('datetime', 'datetime'): datetime.datetime,
+    ('datetime', 'date'): datetime.date,
+}
+
+
+# alternative constructors, e.g. `dt.now()`
+_classmethods = ('now', 'today')
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _evaluate_literal(node, constructors):
+    if isinstance(node, ast.Call) and not node.keywords:
+        if (isinstance(node.func, ast.Name) and
+                node.func.id in constructors):
+            return constructors[node.func.id](*[
+                _evaluate_literal(arg, constructors) for arg in node.args
+            ])
+        if (isinstance(node.func, ast.Attribute) and
+                isinstance(node.func.value, ast.Name) and
+                node.func.value.id in constructors and
+                node.func.attr in _classmethods and not node.args):
+            return getattr(constructors[node.func.value.id], node.func.attr)()
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError):
+        raise _Unsupported()
+
+
+def _evaluate_call(snippet):
+    """
+    Evaluate snippets of the form
+
+        import dash_core_components as dcc
+        from datetime import datetime as dt
+
+        dcc.Component(prop=<literal>, date=dt(<literals>), end=dt.now())
+
+    without `exec`. Raises `_Unsupported` for anything else.
+    """
+    tree = ast.parse(snippet)
+    names = {}
+    for statement in tree.body[:-1]:
+        if isinstance(statement, ast.Import):
+            aliases = [((a.name, None), a) for a in statement.names]
+        elif isinstance(statement, ast.ImportFrom) and not statement.level:
+            aliases = [((statement.module, a.name), a)
+                       for a in statement.names]
+        else:
+            raise _Unsupported()
+        for key, alias in aliases:
+            if key not in _importable:
+                raise _Unsupported()
+            names[alias.asname or alias.name] = _importable[key]
+
+    call = tree.body[-1].value if (
+        tree.body and isinstance(tree.body[-1], ast.Expr)) else None
+    if not (isinstance(call, ast.Call) and
+            isinstance(call.func, ast.Attribute) and
+            isinstance(call.func.value, ast.Name) and
+            names.get(call.func.value.id) is dcc and
+            not getattr(call, 'starargs', None) and
+            not getattr(call, 'kwargs', None) and
+            all(keyword.arg for keyword in call.keywords)):
+        raise _Unsupported()
+
+    constructors = dict(
+        (name, value) for name, value in names.items() if value is not dcc)
+    component_class = getattr(dcc, call.func.attr)
+    return component_class(
+        *[_evaluate_literal(arg, constructors) for arg in call.args],
+        **dict(
+            (keyword.arg, _evaluate_literal(keyword.value, constructors))
+            for keyword in call.keywords
+        )
+    )
+
+
+def _exec_component(example_string):
     scope = {}
     converted_string = example_string.replace('dcc.', 'component = dcc.')
     try:
@@ -17,6 +107,33 @@ def ComponentBlock(example_string, **kwargs):
         ))
 
         raise e
+    return scope['component']
+
+
+def evaluate_component(example_string):
+    """
+    The component that a `ComponentBlock` snippet evaluates to. Snippets
+    that only call a dcc component with literal arguments are evaluated
+    from their AST, anything else is `exec`ed.
+
+    Each snippet is only evaluated once, but every call returns a new
+    copy of the component, so that nothing that's done to one chapter's
+    layout leaks into the other chapters.
+    """
+    source = example_string
+    if not isinstance(source, bytes):
+        source = source.encode('utf-8')
+    key = hashlib.sha1(source).hexdigest()
+    if key not in _components:
+        try:
+            component = _evaluate_call(example_string)
+        except (_Unsupported, SyntaxError):
+            component = _exec_component(example_string)
+        _components[key] = component
+    return copy.deepcopy(_components[key])
+
+
+def ComponentBlock(example_string, **kwargs):
     return html.Div([
         dcc.SyntaxHighlighter(
             example_string,
@@ -24,7 +141,7 @@ def ComponentBlock(example_string, **kwargs):
             customStyle=styles.code_container
         ),
         html.Div(
-            scope['component'],
+            evaluate_component(example_string),
             className='example-container',
             style=(({'overflow-x': 'initial'}) if (
                 'DatePicker' in example_string or
@@ -0,0 +1,44 @@
+import importlib
+import json
+
+import plotly
+
+
+def to_json(value):
+    """
+    Serialize a component tree (or any value that can be a prop) with the
+    same encoder that Dash uses for layouts and callbacks.
+    """
+    return json.dumps(value, cls=plotly.utils.PlotlyJSONEncoder)
+
+
+def _is_component(value):
+    return (
+        isinstance(value, dict) and
+        set(value.keys()) == set(['type', 'namespace', 'props'])
+    )
+
+
+def from_plotly_json(value):
+    """
+    Rebuild the component tree from the output of `to_plotly_json`, i.e. the
+    inverse of `to_json` after `json.loads`. Only the components are
+    rebuilt: other objects (e.g. `go.Figure`) come back as dicts and tuples
+    as lists, like they're sent to the renderer.
+    """
+    if _is_component(value):
+        module = importlib.import_module(value['namespace'])
+        component_class = getattr(module, value['type'])
+        return component_class(**dict(
+            (str(name), from_plotly_json(prop))
+            for name, prop in value['props'].items()
+        ))
+    if isinstance(value, list):
+        return [from_plotly_json(v) for v in value]
+    if isinstance(value, dict):
+        return dict((k, from_plotly_json(v)) for k, v in value.items())
+    return value
+
+
+def from_json(body):
+    return from_plotly_json(json.loads(body))
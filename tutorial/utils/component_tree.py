@@ -0,0 +1,56 @@
+import copy
+
+
+def children_of(component):
+    """
+    The child components (or strings, numbers) of `component` as a list.
+    """
+    children = getattr(component, 'children', None)
+    if children is None:
+        return []
+    if isinstance(children, (list, tuple)):
+        return list(children)
+    return [children]
+
+
+def walk(tree):
+    """
+    Yield every component in `tree` (a component or a list of them),
+    parents before their children.
+    """
+    stack = list(reversed(tree)) if isinstance(tree, (list, tuple)) else [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (list, tuple)):
+            stack.extend(reversed(node))
+        elif hasattr(node, 'to_plotly_json'):
+            yield node
+            stack.extend(reversed(children_of(node)))
+
+
+def component_ids(tree):
+    return set(
+        component.id for component in walk(tree)
+        if getattr(component, 'id', None) is not None
+    )
+
+
+def replace(tree, function):
+    """
+    A copy of `tree` with every component replaced with
+    `function(component)`, where `component` is a (shallow) copy that
+    `function` may modify or return as-is. `tree` itself isn't modified:
+    its subtrees can be shared with other layouts.
+    """
+    if isinstance(tree, (list, tuple)):
+        return type(tree)(replace(node, function) for node in tree)
+    if not hasattr(tree, 'to_plotly_json'):
+        return tree
+    component = copy.copy(tree)
+    replaced = function(component)
+    children = getattr(replaced, 'children', None)
+    if children is not None:
+        if replaced is not component:
+            replaced = copy.copy(replaced)
+        replaced.children = replace(children, function)
+    return replaced
@@ -3,12 +3,21 @@ import json
 import os
 import dash_html_components as html
 import dash_core_components as dcc
-import pandas as pd
 
 
 _current_path = os.path.join(os.path.dirname(os.path.abspath(dcc.__file__)),
                              'metadata.json')
 
+# Prop tables rendered ahead of time by `python build_prop_tables.py`.
+# They're only used if they were built from the installed version of
+# dash_core_components; otherwise the tables are built from metadata.json.
+ARTIFACT_PATH = os.environ.get(
+    'DASH_DOCS_PROP_TABLES',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                 'prop_tables.json')
+)
+_ARTIFACT_FORMAT = 1
+
 
 def js_to_py_type(type_object):
     js_type_name = type_object['name']
@@ -132,93 +141,130 @@ def object_hook_handler(obj):
     return obj
 
 
-with open(_current_path, 'r') as f:
-    metadata = json.load(f, object_hook=object_hook_handler)
-
-
-def get_dataframe(component_name):
-    prefix = 'src/components/'
-    suffix = '.react.js'
-    fullString = prefix+component_name+suffix
-    df = pd.DataFrame(metadata[fullString]
-                      ['props']).transpose()
-    if 'dashEvents' in df.index.tolist():
-        df.drop(['dashEvents'], inplace=True)
-    if 'fireEvent' in df.index:
-        df.drop(['fireEvent'], inplace=True)
-    if 'setAttribute' in df.index:
-        df.drop(['setAttribute'], inplace=True)
-    if 'dashFireEvent' in df.index:
-        df.drop(['dashFireEvent'], inplace=True)
-    if 'className' in df.index.tolist():
-        reindex = ['id', 'className']
-    else:
-        reindex = ['id']
-    reindex.extend(df.loc[(df.index != 'id') &
-                          (df.index != 'className')].index.tolist())
-    df['Attribute'] = df.index
-    df = df.reindex(reindex)
-    df.fillna('', inplace=True)
-    if 'Default Value' in df.columns.values.tolist():
-        df = df[['Attribute', 'Description', 'Type', 'Default Value']]
-    else:
-        df = df[['Attribute', 'Description', 'Type']]
+def read_metadata():
+    with open(_current_path, 'r') as f:
+        return json.load(f, object_hook=object_hook_handler)
+
+
+_prefix = 'src/components/'
+_suffix = '.react.js'
+
+# props that are part of the component API but not useful to document
+_hidden_props = ['dashEvents', 'fireEvent', 'setAttribute', 'dashFireEvent']
 
-    if 'config' in df['Attribute']:
-        df.set_value('config', 'Type',
-                     'dict, check Plotly.js docs for more information')
-        df.set_value('config', 'Default Value',
-                     '{}')
-    return df
+_overrides = {
+    'config': {
+        'Type': 'dict, check Plotly.js docs for more information',
+        'Default Value': '{}'
+    }
+}
+
+
+def _format_cell(column, value):
+    if column == 'Type':
+        return value.replace('true', '`True`')\
+                    .replace('false', '`False`')\
+                    .replace('\n', '\n\n')\
+                    .replace('    ', '')
+    elif column == 'Description':
+        return value.replace('true', '`True`')\
+                    .replace('false', '`False`')
+    return value
+
+
+def get_records(props):
+    """
+    The columns and the formatted rows of the prop table for the `props`
+    of a component in metadata.json: `id` and `className` first and the
+    rest of the props in alphabetical order.
+    """
+    if any('Default Value' in prop for prop in props.values()):
+        columns = ['Attribute', 'Description', 'Type', 'Default Value']
+    else:
+        columns = ['Attribute', 'Description', 'Type']
 
+    names = sorted(
+        name for name in props
+        if name not in _hidden_props and name not in ('id', 'className')
+    )
+    names = (['id', 'className'] if 'className' in props else ['id']) + names
 
-def generate_table(dataframe):
     rows = []
-    for i in range(len(dataframe)):
+    for name in names:
+        if name not in props:
+            rows.append(tuple('' for column in columns))
+            continue
+        prop = dict(props[name], Attribute=name, **_overrides.get(name, {}))
+        rows.append(tuple(
+            _format_cell(column, '' if prop.get(column) is None
+                         else prop.get(column))
+            for column in columns
+        ))
+    return (tuple(columns), rows)
+
+
+def build_records(metadata):
+    return dict(
+        (name[len(_prefix):-len(_suffix)], get_records(component['props']))
+        for name, component in metadata.items()
+        if name.startswith(_prefix) and name.endswith(_suffix)
+    )
+
+
+def write_artifact(path=ARTIFACT_PATH):
+    with open(path, 'w') as f:
+        json.dump({
+            'format': _ARTIFACT_FORMAT,
+            'dash_core_components': dcc.__version__,
+            'tables': dict(
+                (name, {'columns': columns, 'rows': rows})
+                for name, (columns, rows)
+                in build_records(read_metadata()).items()
+            )
+        }, f, indent=1, sort_keys=True)
+
+
+def read_artifact(path=ARTIFACT_PATH):
+    try:
+        with open(path, 'r') as f:
+            artifact = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    if (artifact.get('format') != _ARTIFACT_FORMAT or
+            artifact.get('dash_core_components') != dcc.__version__):
+        return None
+    return dict(
+        (name, (tuple(table['columns']), [tuple(r) for r in table['rows']]))
+        for name, table in artifact['tables'].items()
+    )
+
+
+# formatted (columns, rows) of every component's prop table
+records = read_artifact() or build_records(read_metadata())
+
+
+def generate_table(columns, rows):
+    body = []
+    for row in rows:
         internalRow = []
-        for col in dataframe.columns:
-            # Body
-            if(type(dataframe.iloc[i][col]) == tuple and
-               type(dataframe.iloc[i][col][1][0]) != dict):
-                internalRow.append(html.Td(dataframe.iloc[i][col][0] + ': ' +
-                                           str([str(j) for j in dataframe.iloc[i][col]
-                                                [1]])))
-            elif(type(dataframe.iloc[i][col]) == tuple and
-                 type(dataframe.iloc[i][col][1][0]) == dict):
-                internalRow.append(html.Td('Array of Dict: ' +
-                                           str(dataframe.iloc[i][col][1])))
+        for col, value in zip(columns, row):
+            if col == 'Type':
+                internalRow.append(html.Td(dcc.Markdown(value),
+                                           style={'text-align': 'left'}))
+            elif col == 'Description':
+                internalRow.append(html.Td(dcc.Markdown(value),
+                                           style={'font-size': '0.95em'}))
             else:
-                if col == 'Type':
-                    internalRow.append(html.Td(
-                        dcc.Markdown(dataframe.iloc[i][col]\
-                            .replace('true', '`True`')\
-                            .replace('false', '`False`')\
-                            .replace('\n', '\n\n')\
-                            .replace('    ', '')
-                        ),
-                        style={'text-align': 'left'}))
-                elif col == 'Description':
-                    internalRow.append(
-                        html.Td(dcc.Markdown(
-                            dataframe.iloc[i][col]\
-                                .replace('true', '`True`')\
-                                .replace('false', '`False`')
-                            ),
-                                style={'font-size': '0.95em'})
-                    )
-                else:
-                    internalRow.append(html.Td(
-                        dcc.Markdown(
-                            dataframe.iloc[i][col]
-                        )
-                    ))
-        rows.append(html.Tr(internalRow))
+                internalRow.append(html.Td(dcc.Markdown(value)))
+        body.append(html.Tr(internalRow))
     table = html.Table(
             [html.Tr([html.Th(col, style={'text-align': 'left'}) for col in
-                      dataframe.columns])] + rows)
+                      columns])] + body)
 
     return table
 
 
 def generate_prop_table(component_name):
-    return generate_table(get_dataframe(component_name))
+    # the rows are precomputed, but every call gets its own components, so
+    # that nothing that's done to one chapter's layout leaks into the others
+    return generate_table(*records[component_name])
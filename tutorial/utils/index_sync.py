@@ -0,0 +1,182 @@
+"""
+Sync the records of a search index incrementally.
+
+A manifest stores the content hash of every record that was pushed, by
+its `objectID`. `sync` compares it with the new records and only saves the
+records that were added or changed and deletes the ones that are gone, in
+batches. Records are saved before any are deleted and the index is never
+cleared, so it's never empty while it's updated.
+
+A backend is a search index that stores records by their `objectID`:
+`AlgoliaBackend` for the hosted index and `FileBackend`, a JSON file, for
+testing and offline use. Backends have a `name` (recorded in the manifest)
+and implement `save(records)`, which adds the records and replaces those
+with the same `objectID`, `delete(object_ids)` and `object_ids()`, the
+`objectID` of every record in the index (only needed when there's no
+manifest).
+"""
+import hashlib
+import json
+import os
+
+# the most records per request
+BATCH_SIZE = 100
+
+_MANIFEST_FORMAT = 1
+
+
+def record_hash(record):
+    data = json.dumps(record, sort_keys=True, separators=(',', ':'))
+    if not isinstance(data, bytes):
+        data = data.encode('utf-8')
+    return hashlib.sha1(data).hexdigest()
+
+
+def batches(items, size=BATCH_SIZE):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class AlgoliaBackend(object):
+    def __init__(self, index):
+        self.index = index
+        self.name = 'algolia:{}'.format(index.index_name)
+
+    def _wait(self, response):
+        self.index.wait_task(response['taskID'])
+
+    def save(self, records):
+        self._wait(self.index.save_objects(records))
+
+    def delete(self, object_ids):
+        self._wait(self.index.delete_objects(object_ids))
+
+    def object_ids(self):
+        return [
+            hit['objectID'] for hit in
+            self.index.browse_all({'attributesToRetrieve': ['objectID']})
+        ]
+
+
+class FileBackend(object):
+    """
+    An index stored in the JSON file at `path`, a dict of the records by
+    their `objectID`.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.name = 'file:{}'.format(os.path.abspath(path))
+
+    def records(self):
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (IOError, OSError):
+            return {}
+
+    def _write(self, records):
+        _write_json(self.path, records)
+
+    def save(self, records):
+        stored = self.records()
+        for record in records:
+            stored[record['objectID']] = record
+        self._write(stored)
+
+    def delete(self, object_ids):
+        stored = self.records()
+        for object_id in object_ids:
+            stored.pop(object_id, None)
+        self._write(stored)
+
+    def object_ids(self):
+        return list(self.records())
+
+
+def _write_json(path, value):
+    # write to a temporary file first so that an interrupted write never
+    # leaves a partial file behind
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    with open(tmp_path, 'w') as f:
+        json.dump(value, f, indent=1, sort_keys=True)
+    os.rename(tmp_path, path)
+
+
+def read_manifest(path, backend):
+    """
+    The hashes of the records that were pushed to `backend`, by
+    `objectID`, or None if there's no (valid) manifest for it at `path`.
+    """
+    try:
+        with open(path, 'r') as f:
+            manifest = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    if (manifest.get('format') != _MANIFEST_FORMAT or
+            manifest.get('index') != backend.name):
+        return None
+    return manifest['records']
+
+
+def write_manifest(path, backend, hashes):
+    _write_json(path, {
+        'format': _MANIFEST_FORMAT,
+        'index': backend.name,
+        'records': hashes
+    })
+
+
+def diff(records, hashes):
+    """
+    The `(added, updated, deleted)` records of `records` compared to the
+    `hashes` of the records in the index: the records that are new, the
+    records that changed and the `objectID`s of the records that are gone.
+    A hash of None is always treated as changed.
+    """
+    added = []
+    updated = []
+    object_ids = set()
+    for record in records:
+        object_id = record['objectID']
+        object_ids.add(object_id)
+        if object_id not in hashes:
+            added.append(record)
+        elif hashes[object_id] != record_hash(record):
+            updated.append(record)
+    deleted = sorted(set(hashes) - object_ids)
+    return added, updated, deleted
+
+
+def sync(backend, records, manifest_path, batch_size=BATCH_SIZE):
+    """
+    Update `backend` to hold exactly `records` (dicts with a unique
+    `objectID`), pushing only what changed since the manifest at
+    `manifest_path` was written. Without a manifest, every record is saved
+    and the records that the backend has but `records` doesn't are
+    deleted. Returns `(added, updated, deleted)`, see `diff`.
+
+    The manifest is only written once the backend is up to date, so an
+    interrupted sync is completed by the next one.
+    """
+    object_ids = [record['objectID'] for record in records]
+    if len(set(object_ids)) != len(object_ids):
+        raise ValueError('objectIDs must be unique')
+
+    hashes = read_manifest(manifest_path, backend)
+    if hashes is None:
+        hashes = dict(
+            (object_id, None) for object_id in backend.object_ids())
+    added, updated, deleted = diff(records, hashes)
+
+    for batch in batches(added + updated, batch_size):
+        backend.save(batch)
+    for batch in batches(deleted, batch_size):
+        backend.delete(batch)
+
+    write_manifest(manifest_path, backend, dict(
+        (record['objectID'], record_hash(record)) for record in records))
+    return added, updated, deleted
@@ -0,0 +1,90 @@
+"""
+Structural sharing of the subtrees that layouts repeat.
+
+Chapters are built by functions that create a new component for every
+occurrence of the same markup (e.g. the rows of the prop tables, or the
+same Markdown in several chapters). `InternTable.intern` replaces every
+subtree that is equal to a subtree that it has already seen with that one,
+so that each worker only keeps one copy of it.
+
+Only subtrees without ids are shared: they can't be the target of a
+callback, and nothing modifies them after they're built (passes over the
+layouts, such as `component_tree.replace`, return copies).
+"""
+import hashlib
+import json
+
+import plotly
+
+
+def _digest(*parts):
+    sha1 = hashlib.sha1()
+    for part in parts:
+        sha1.update(part.encode('utf-8') if not isinstance(part, bytes)
+                    else part)
+        sha1.update(b'\0')
+    return sha1.hexdigest()
+
+
+def _json(value):
+    return json.dumps(
+        value, cls=plotly.utils.PlotlyJSONEncoder, sort_keys=True)
+
+
+class InternTable(object):
+    """
+    The subtrees that have been interned, by the digest of their structure.
+    """
+
+    def __init__(self):
+        self._components = {}
+        # how many subtrees were replaced by a shared one
+        self.shared = 0
+
+    def __len__(self):
+        return len(self._components)
+
+    def intern(self, tree):
+        """
+        Return `tree` (a component, a list of them or any prop value) with
+        each subtree that is equal to one that was interned before replaced
+        with that one. Children are replaced in place.
+        """
+        return self._intern(tree)[0]
+
+    def _intern(self, node):
+        """
+        Return `(node, digest)`, where `digest` identifies the structure of
+        `node` or is None if `node` can't be shared.
+        """
+        if isinstance(node, (list, tuple)):
+            interned = [self._intern(child) for child in node]
+            if any(new is not old for (new, _), old in zip(interned, node)):
+                node = [new for new, _ in interned]
+            digests = [digest for _, digest in interned]
+            if None in digests:
+                return node, None
+            return node, _digest('list', *digests)
+
+        if not hasattr(node, 'to_plotly_json'):
+            return node, _digest(_json(node))
+
+        children = getattr(node, 'children', None)
+        children_digest = _digest('null')
+        if children is not None:
+            interned_children, children_digest = self._intern(children)
+            if interned_children is not children:
+                node.children = interned_children
+
+        if getattr(node, 'id', None) is not None or children_digest is None:
+            return node, None
+
+        component = node.to_plotly_json()
+        props = dict(component['props'])
+        props.pop('children', None)
+        digest = _digest(component['namespace'], component['type'],
+                         _json(props), children_digest)
+        shared = self._components.setdefault(digest, node)
+        if shared is not node:
+            self.shared += 1
+        return shared, digest
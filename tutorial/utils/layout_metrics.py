@@ -0,0 +1,148 @@
+"""
+The size of component trees: how many bytes they serialize to, how many
+components and how deep they are, which subtrees are the largest and which
+are duplicated. See `benchmarks/layout_budget.py`.
+"""
+import hashlib
+import json
+
+import plotly
+
+from .component_tree import children_of
+
+# the metrics that a budget can limit
+BUDGET_METRICS = ('bytes', 'nodes', 'depth')
+
+# a component is a wrapper of its child if the child is this much of it
+WRAPPER_RATIO = 0.9
+
+
+def _size(value):
+    return len(json.dumps(
+        value, cls=plotly.utils.PlotlyJSONEncoder, sort_keys=True
+    ).encode('utf-8'))
+
+
+def _label(component, index):
+    name = type(component).__name__
+    component_id = getattr(component, 'id', None)
+    if component_id is not None:
+        name = '{}#{}'.format(name, component_id)
+    return name if index is None else '{}[{}]'.format(name, index)
+
+
+def subtrees(tree):
+    """
+    Yield `(component, path, depth)` for every component in `tree`,
+    parents before their children. `path` is the tuple of labels (type, id
+    and index among its siblings) from the root to the component.
+    """
+    stack = [(tree, None, (), 1)]
+    while stack:
+        node, index, path, depth = stack.pop()
+        if isinstance(node, (list, tuple)):
+            stack.extend(reversed([
+                (child, i, path, depth) for i, child in enumerate(node)]))
+        elif hasattr(node, 'to_plotly_json'):
+            path = path + (_label(node, index),)
+            yield node, path, depth
+            children = children_of(node)
+            stack.extend(reversed([
+                (child, i if len(children) > 1 else None, path, depth + 1)
+                for i, child in enumerate(children)]))
+
+
+def _components(children):
+    for child in children:
+        if isinstance(child, (list, tuple)):
+            for component in _components(child):
+                yield component
+        elif hasattr(child, 'to_plotly_json'):
+            yield child
+
+
+def measure(tree, top=5, min_duplicate_bytes=200):
+    """
+    The metrics of `tree`:
+
+    - `bytes`: the size of its JSON
+    - `nodes`: the number of components
+    - `depth`: the number of components on the longest path from the root
+    - `largest`: the `top` largest subtrees below the root, as
+      `(bytes, path)`, largest first. Wrappers, whose size is mostly that
+      of one of their children, are skipped in favour of that child.
+    - `duplicates`: the `top` subtrees that are repeated, as
+      `(bytes wasted by the copies, copies, bytes, path of the first)`.
+      Subtrees smaller than `min_duplicate_bytes` aren't reported, and
+      neither are subtrees that are only repeated because their parent is.
+    """
+    nodes = 0
+    depth = 0
+    occurrences = {}
+    parents = {}
+    first_paths = {}
+    sizes = {}
+    # the digest and size of each component's subtree, by id(component)
+    digests = {}
+    component_sizes = {}
+
+    for component, path, component_depth in subtrees(tree):
+        nodes += 1
+        depth = max(depth, component_depth)
+        data = json.dumps(
+            component, cls=plotly.utils.PlotlyJSONEncoder, sort_keys=True
+        ).encode('utf-8')
+        digest = hashlib.sha1(data).hexdigest()
+        digests[id(component)] = digest
+        component_sizes[id(component)] = len(data)
+        if len(data) < min_duplicate_bytes:
+            continue
+        occurrences[digest] = occurrences.get(digest, 0) + 1
+        sizes[digest] = len(data)
+        first_paths.setdefault(digest, path)
+        parents.setdefault(digest, set())
+
+    # now that every subtree has a digest and a size: the parents of the
+    # repeated subtrees and the largest subtrees that aren't wrappers
+    largest = []
+    for component, path, _ in subtrees(tree):
+        parent_digest = digests[id(component)]
+        children = list(_components(children_of(component)))
+        for child in children:
+            digest = digests[id(child)]
+            if digest in parents:
+                parents[digest].add(parent_digest)
+        size = component_sizes[id(component)]
+        if len(path) > 1 and not any(
+                component_sizes[id(child)] > WRAPPER_RATIO * size
+                for child in children):
+            largest.append((size, path))
+
+    duplicates = [
+        (size * (occurrences[digest] - 1), occurrences[digest], size,
+         first_paths[digest])
+        for digest, size in sizes.items()
+        if occurrences[digest] > 1 and not all(
+            occurrences.get(parent, 0) > 1 for parent in parents[digest])
+    ]
+
+    return {
+        'bytes': _size(tree),
+        'nodes': nodes,
+        'depth': depth,
+        'largest': sorted(largest, key=lambda l: l[0], reverse=True)[:top],
+        'duplicates': sorted(duplicates, reverse=True)[:top]
+    }
+
+
+def over_budget(metrics, budget):
+    """
+    The metrics of `metrics` that exceed `budget` (a dict of limits for
+    some of `BUDGET_METRICS`; missing or `None` limits aren't checked), as
+    `(metric, value, limit)`.
+    """
+    return [
+        (metric, metrics[metric], budget[metric])
+        for metric in BUDGET_METRICS
+        if budget.get(metric) is not None and metrics[metric] > budget[metric]
+    ]
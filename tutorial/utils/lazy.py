@@ -0,0 +1,123 @@
+import importlib
+import threading
+import time
+import traceback
+
+
+class LazyLayout(object):
+    """
+    A layout that is imported from its module the first time it's needed.
+
+    Chapter modules run their examples at import time (which execs example
+    apps, reads remote datasets and registers callbacks on the shared app),
+    so importing them is deferred until the chapter is requested.
+
+    `transform`, if given, is called with the layout once it's imported
+    and its return value is used instead. `prepare`, if given, is called
+    with the `LazyLayout` before its module is imported, outside of the
+    import and without the layout lock (see `warm_up`).
+    """
+
+    # chapter modules import each other and register callbacks on the same
+    # app, so only one layout is loaded at a time
+    _lock = threading.RLock()
+    # a module that failed half way through may already have registered
+    # some of its callbacks, so failed modules aren't imported again
+    _errors = {}
+
+    def __init__(self, module, attribute='layout', transform=None,
+                 prepare=None):
+        self.module = module
+        self.attribute = attribute
+        self.transform = transform
+        self.prepare = prepare
+        self._layout = None
+        self._loaded = False
+
+    def __repr__(self):
+        return 'LazyLayout({!r}, {!r})'.format(self.module, self.attribute)
+
+    @property
+    def pending(self):
+        return not self._loaded and self.module not in self._errors
+
+    def load(self):
+        if self.pending and self.prepare is not None:
+            self.prepare(self)
+        if not self._loaded:
+            with self._lock:
+                if self.module in self._errors:
+                    raise self._errors[self.module]
+                if not self._loaded:
+                    try:
+                        module = importlib.import_module(self.module)
+                    except Exception as e:
+                        self._errors[self.module] = e
+                        raise
+                    self._layout = getattr(module, self.attribute)
+                    if self.transform is not None:
+                        self._layout = self.transform(self._layout)
+                    self._loaded = True
+        return self._layout
+
+
+def load_layout(content):
+    """
+    Return `content` with any `LazyLayout`s in it loaded.
+    """
+    if isinstance(content, LazyLayout):
+        return content.load()
+    if isinstance(content, list):
+        return [load_layout(c) for c in content]
+    return content
+
+
+def lazy_layouts(content):
+    """
+    Yield the `LazyLayout`s in `content`.
+    """
+    if isinstance(content, LazyLayout):
+        yield content
+    elif isinstance(content, list):
+        for c in content:
+            for layout in lazy_layouts(c):
+                yield layout
+
+
+def warm_up(layouts, background=True, prepare=None):
+    """
+    Load every pending `LazyLayout` in `layouts`, in a daemon thread if
+    `background`. Errors are printed and don't stop the remaining layouts
+    from loading.
+
+    `prepare` is called with the pending layouts before any of them is
+    loaded. It runs outside of any import and without the layout lock, so
+    it can use threads that import modules themselves (Python 2 holds a
+    global import lock while a module is being imported) and chapters can
+    still be loaded on demand while it runs.
+    """
+    def run():
+        pending = [l for l in layouts if l.pending]
+        if not pending:
+            return
+        start = time.time()
+        if prepare is not None:
+            prepare(pending)
+        # each layout takes the lock while it loads, so requests for other
+        # chapters are served in between
+        for layout in pending:
+            try:
+                layout.load()
+            except Exception:
+                print('\nError loading {}'.format(layout))
+                traceback.print_exc()
+        print('Loaded {} layouts in {:.2f}s'.format(
+            len(pending), time.time() - start))
+
+    if not background:
+        run()
+        return None
+    thread = threading.Thread(target=run, name='layout-warm-up')
+    thread.daemon = True
+    thread.start()
+    return thread
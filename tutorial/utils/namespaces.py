@@ -0,0 +1,72 @@
+"""
+Prefixing component ids, so that examples that use the same ids can be
+mounted in the same app, see `tools.ExampleApp`.
+"""
+import copy
+
+from six import string_types, text_type
+
+from .component_tree import replace
+
+
+class NamespacedId(text_type):
+    """
+    A component id prefixed with a namespace, which keeps the `original`
+    id (the one in the example's source).
+    """
+
+    def __new__(cls, namespace, original):
+        component_id = super(NamespacedId, cls).__new__(
+            cls, u'{}-{}'.format(namespace, original))
+        component_id.namespace = namespace
+        component_id.original = original
+        return component_id
+
+    def __getnewargs__(self):
+        return (self.namespace, self.original)
+
+
+def namespace_id(namespace, component_id):
+    if isinstance(component_id, NamespacedId):
+        return component_id
+    return NamespacedId(namespace, component_id)
+
+
+def namespace_ids(namespace, tree):
+    """
+    A copy of `tree` with the ids of its components prefixed with
+    `namespace`. Ids that are already namespaced are left alone, so that
+    components that end up in a callback's return value more than once
+    keep a single prefix. Anything that isn't a component (e.g. a
+    callback's return value that's a string) is returned as-is.
+
+    The ids that labels refer to (`htmlFor`) are prefixed the same way, so
+    that they keep pointing at their inputs.
+
+    Components that can have `data-*` attributes (the `html` ones) get the
+    original id as their `data-id`, so that the page can be matched with
+    the example's source.
+    """
+    def prefix(component):
+        component_id = getattr(component, 'id', None)
+        if isinstance(component_id, string_types):
+            component.id = namespace_id(namespace, component_id)
+            if ('data-' in getattr(component, '_valid_wildcard_attributes', [])
+                    and not hasattr(component, 'data-id')):
+                setattr(component, 'data-id', component.id.original)
+        html_for = getattr(component, 'htmlFor', None)
+        if isinstance(html_for, string_types):
+            component.htmlFor = namespace_id(namespace, html_for)
+        return component
+
+    return replace(tree, prefix)
+
+
+def namespace_dependency(namespace, dependency):
+    """
+    A copy of the `Input`, `Output`, `State` or `Event` `dependency` with
+    its component id prefixed with `namespace`.
+    """
+    dependency = copy.copy(dependency)
+    dependency.component_id = namespace_id(namespace, dependency.component_id)
+    return dependency
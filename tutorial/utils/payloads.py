@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+from gzip import GzipFile
+from io import BytesIO
+
+import flask
+import plotly
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from .cache import LRUCache
+
+# how long clients and shared caches may reuse the response of a GET route
+# that only changes on deploy (e.g. `/_search`) without revalidating it
+MAX_AGE = int(os.environ.get('DASH_DOCS_PAYLOAD_MAX_AGE', 60 * 60))
+
+# deterministic responses are compressed once, so they can afford the
+# highest levels; smaller bodies aren't worth compressing
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+COMPRESS_MIN_SIZE = 500
+
+# compressed bodies, by (sha1 of the body, encoding); search responses
+# differ for every query, so only the most recently used are kept
+ENCODED_CACHE_SIZE = 512
+_encoded = LRUCache(maxsize=ENCODED_CACHE_SIZE)
+
+
+def serialize_response(output, value):
+    """
+    Serialize a callback return value the same way that `dash.Dash.callback`
+    does, returning the JSON body as bytes.
+    """
+    body = json.dumps(
+        {'response': {'props': {output.component_property: value}}},
+        cls=plotly.utils.PlotlyJSONEncoder
+    )
+    if not isinstance(body, bytes):
+        body = body.encode('utf-8')
+    return body
+
+
+class PayloadCache(object):
+    """
+    Serialized callback responses, keyed by whatever identifies the
+    response (e.g. the chapter key for the chapter router).
+
+    Payloads are built on first use and kept for the lifetime of the worker.
+    Two threads may race to build the same payload; both produce the same
+    bytes so the last write wins without needing a lock.
+    """
+
+    def __init__(self):
+        self._payloads = {}
+        self._etags = {}
+
+    def __contains__(self, key):
+        return key in self._payloads
+
+    def __len__(self):
+        return len(self._payloads)
+
+    def get(self, key, build):
+        payload = self._payloads.get(key)
+        if payload is None:
+            payload = build()
+            self._payloads[key] = payload
+        return payload
+
+    def etag(self, key):
+        """
+        The content hash of the payload stored for `key`.
+        """
+        if key not in self._etags:
+            payload = self._payloads[key]
+            if not isinstance(payload, bytes):
+                payload = payload.encode('utf-8')
+            self._etags[key] = hashlib.sha1(payload).hexdigest()
+        return self._etags[key]
+
+    def clear(self):
+        self._payloads.clear()
+        self._etags.clear()
+
+
+def compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    buffer = BytesIO()
+    # a fixed mtime keeps the output (and so the ETag) deterministic
+    with GzipFile(mode='wb', compresslevel=GZIP_LEVEL, fileobj=buffer,
+                  mtime=0) as f:
+        f.write(body)
+    return buffer.getvalue()
+
+
+def _accepted_encoding(body):
+    if len(body) < COMPRESS_MIN_SIZE:
+        return None
+    accept_encodings = flask.request.accept_encodings
+    if brotli is not None and accept_encodings['br']:
+        return 'br'
+    if accept_encodings['gzip']:
+        return 'gzip'
+    return None
+
+
+def _encode(response, body, digest, max_age=None):
+    """
+    Set the body of `response` to `body` in the encoding that the client
+    accepts, compressing it only the first time that it's served (as long
+    as it's among the most recently served bodies). Flask-Compress leaves
+    responses that already have a Content-Encoding alone.
+
+    The response can be cached for `max_age` seconds, unless it's None.
+    """
+    if response.status_code != 200:
+        return response
+    encoding = _accepted_encoding(body)
+    if encoding is None:
+        response.set_etag(digest)
+    else:
+        response.set_data(_encoded.get_or_set(
+            (digest, encoding), lambda: compress(body, encoding)))
+        response.headers['Content-Encoding'] = encoding
+        # each representation needs its own ETag
+        response.set_etag('{}-{}'.format(digest, encoding))
+    response.vary.add('Accept-Encoding')
+    if max_age is not None:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    return response
+
+
+def payload_response(body, etag):
+    """
+    A JSON response for `body` with its `etag`, precompressed for clients
+    that accept it. Requests that already have the payload
+    (`If-None-Match`) get an empty 304 response.
+
+    Callbacks are POSTed, which browsers and shared caches don't cache, so
+    the response has no caching headers: only clients that revalidate
+    with the ETag themselves skip the download. This isn't left to
+    `make_conditional`, which only handles GET requests.
+    """
+    response = _encode(
+        flask.Response(body, mimetype='application/json'), body, etag)
+    if flask.request.if_none_match.contains_raw(response.headers['ETag']):
+        response.status_code = 304
+        response.set_data(b'')
+        response.headers.pop('Content-Encoding', None)
+    return response
+
+
+def conditional(view, max_age=0):
+    """
+    Wrap the GET `view` so that its response is precompressed and carries
+    an ETag (and a 304 is returned for requests that already have it).
+    With the default `max_age` of 0 clients revalidate on every request,
+    which is what the Dash routes need since their responses change on
+    every deploy.
+    """
+    def serve(*args, **kwargs):
+        response = flask.make_response(view(*args, **kwargs))
+        body = response.get_data()
+        _encode(response, body, hashlib.sha1(body).hexdigest(), max_age)
+        return response.make_conditional(flask.request)
+
+    return serve
+
+
+def cached_callback(app, output, inputs=[], state=[], key=None, cache=None):
+    """
+    Like `app.callback`, but for callbacks whose output only depends on
+    `key(*args)`. The serialized response for each key is stored in `cache`
+    and served as-is on subsequent calls, skipping both the callback and
+    the JSON encoding of its return value. Responses carry the payload's
+    hash as their ETag, see `payload_response`.
+
+    The decorated function is returned undecorated so that it can still be
+    called directly to get the component tree.
+    """
+    cache = cache if cache is not None else PayloadCache()
+    callback_id = '{}.{}'.format(output.component_id, output.component_property)
+
+    def wrap_func(func):
+        app.callback(output, inputs, state)(func)
+
+        def serve(*args):
+            payload_key = key(*args)
+            body = cache.get(
+                payload_key,
+                lambda: serialize_response(output, func(*args))
+            )
+            return payload_response(body, cache.etag(payload_key))
+
+        # replace the handler that `app.callback` registered; dispatch
+        # looks it up in the callback map on every request
+        app.callback_map[callback_id]['callback'] = serve
+        return func
+
+    return wrap_func
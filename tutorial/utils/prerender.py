@@ -0,0 +1,147 @@
+"""
+Render a component tree to static HTML.
+
+The HTML is embedded in the index page so that there is something to read
+(and to crawl) before `dash-renderer` has loaded the layout and called the
+callbacks. It doesn't need to match what React renders exactly since the
+renderer replaces it once it's ready: `html.*` components, `dcc.Markdown`,
+`dcc.SyntaxHighlighter` and `dcc.Link` are rendered, other components only
+render their children (e.g. an empty placeholder for a `dcc.Graph`).
+"""
+import re
+
+import markdown
+import six
+from markupsafe import escape
+
+# props that are only meaningful to React or to the callbacks
+_ignored_props = set([
+    'children', 'n_clicks', 'n_clicks_timestamp', 'key', 'setProps',
+    'fireEvent', 'dashEvents'
+])
+
+_attribute_names = {
+    'className': 'class',
+    'htmlFor': 'for'
+}
+
+_void_elements = set([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr'
+])
+
+# style properties that React doesn't suffix with `px`
+_unitless_styles = set([
+    'flex', 'flexGrow', 'flexShrink', 'fontWeight', 'lineHeight',
+    'opacity', 'order', 'orphans', 'widows', 'zIndex', 'zoom'
+])
+
+_camel_case = re.compile(r'([A-Z])')
+
+
+def _text(value):
+    if isinstance(value, bytes):
+        return value.decode('utf-8')
+    return six.text_type(value)
+
+
+def _style(style):
+    declarations = []
+    for name, value in sorted(style.items()):
+        if (isinstance(value, (int, float)) and value != 0 and
+                name not in _unitless_styles):
+            value = '{}px'.format(value)
+        declarations.append(u'{}: {}'.format(
+            _camel_case.sub(r'-\1', name).lower(), _text(value)))
+    return u'; '.join(declarations)
+
+
+def _attributes(props):
+    attributes = []
+    for name, value in sorted(props.items()):
+        if name in _ignored_props or value is None or value is False:
+            continue
+        name = _attribute_names.get(name, name)
+        if name == 'style' and isinstance(value, dict):
+            value = _style(value)
+        if value is True:
+            attributes.append(u' {}'.format(name.lower()))
+        else:
+            attributes.append(u' {}="{}"'.format(
+                name.lower(), escape(_text(value))))
+    return u''.join(attributes)
+
+
+def _element(tag, props, content):
+    if tag in _void_elements:
+        return u'<{}{}>'.format(tag, _attributes(props))
+    return u'<{tag}{attributes}>{content}</{tag}>'.format(
+        tag=tag, attributes=_attributes(props), content=content)
+
+
+def _source(children):
+    # like dcc.Markdown and dcc.SyntaxHighlighter, lists are lines
+    if isinstance(children, (list, tuple)):
+        return u'\n'.join(_text(c) for c in children)
+    return _text(children) if children is not None else u''
+
+
+def render(component, children=None, skip=None):
+    """
+    Render `component` (a component, a string, a number or a list of them)
+    to an HTML string. `children` maps component ids to the children that
+    they should be rendered with instead of their own, e.g. the output of
+    a callback. Components whose id `skip(id)` is true for aren't rendered
+    at all.
+    """
+    children = children or {}
+
+    if component is None:
+        return u''
+    if isinstance(component, (list, tuple)):
+        return u''.join(render(c, children, skip) for c in component)
+    if not hasattr(component, 'to_plotly_json'):
+        return escape(_text(component))
+
+    props = dict(
+        (name, getattr(component, name))
+        for name in component._prop_names
+        if hasattr(component, name)
+    )
+    if (skip is not None and props.get('id') is not None and
+            skip(props['id'])):
+        return u''
+    content = children.get(props.get('id'), props.get('children'))
+    namespace = component._namespace
+    component_type = component._type
+
+    if namespace == 'dash_html_components':
+        return _element(
+            component_type.lower(), props, render(content, children, skip))
+
+    if namespace == 'dash_core_components':
+        if component_type == 'Markdown':
+            return _element(
+                'div', {'id': props.get('id'),
+                        'className': props.get('className')},
+                markdown.markdown(_source(content),
+                                  extensions=['fenced_code']))
+        if component_type == 'SyntaxHighlighter':
+            return _element(
+                'pre', {'id': props.get('id'),
+                        'style': props.get('customStyle')},
+                _element(
+                    'code',
+                    {'className': 'language-{}'.format(
+                        props.get('language', 'python'))},
+                    escape(_source(content))))
+        if component_type == 'Link':
+            return _element(
+                'a', {'id': props.get('id'), 'href': props.get('href'),
+                      'className': props.get('className')},
+                render(content, children, skip))
+
+    return _element(
+        'div', {'id': props.get('id'), 'className': props.get('className'),
+                'style': props.get('style')},
+        render(content, children, skip))
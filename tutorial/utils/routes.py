@@ -0,0 +1,66 @@
+import re
+
+_repeated_slashes = re.compile(r'/{2,}')
+
+
+def normalize_pathname(pathname):
+    """
+    Reduce a pathname to the form used as a key in the route table:
+    query strings and fragments dropped, repeated slashes collapsed and
+    the trailing slash removed (except for the root).
+    """
+    if pathname is None:
+        return None
+    pathname = pathname.split('?', 1)[0].split('#', 1)[0]
+    pathname = _repeated_slashes.sub('/', pathname.strip())
+    if not pathname.startswith('/'):
+        pathname = '/' + pathname
+    if len(pathname) > 1:
+        pathname = pathname.rstrip('/') or '/'
+    return pathname
+
+
+class RouteTable(object):
+    """
+    Maps URLs to chapter keys.
+
+    The table is built once from the `chapters` dict so that resolving a
+    pathname is a single dict lookup instead of a scan over every chapter.
+    Pathnames that don't match a chapter exactly fall back to the closest
+    parent chapter, e.g. `/dash-core-components/unknown` resolves to the
+    `/dash-core-components` chapter. Anything else resolves to `default`.
+    """
+
+    def __init__(self, chapters, default='index'):
+        self.default = default
+        self.routes = {}
+        for key, chapter in chapters.items():
+            url = normalize_pathname(chapter['url'])
+            if url in self.routes and self.routes[url] != key:
+                raise Exception(
+                    'Chapters "{}" and "{}" share the url "{}"'.format(
+                        self.routes[url], key, url))
+            self.routes[url] = key
+
+    def __contains__(self, pathname):
+        return normalize_pathname(pathname) in self.routes
+
+    def __len__(self):
+        return len(self.routes)
+
+    def resolve(self, pathname):
+        pathname = normalize_pathname(pathname)
+        if pathname is None:
+            return None
+        if pathname in self.routes:
+            return self.routes[pathname]
+        return self._resolve_prefix(pathname)
+
+    def _resolve_prefix(self, pathname):
+        # walk up the path one segment at a time; the root is never used as
+        # a prefix so unknown top-level pages still land on the default
+        while pathname.count('/') > 1:
+            pathname = pathname.rsplit('/', 1)[0]
+            if pathname in self.routes:
+                return self.routes[pathname]
+        return self.default
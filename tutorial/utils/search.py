@@ -0,0 +1,199 @@
+"""
+Full-text search over the docs, in process: an inverted index of the
+documents' fields ranked with BM25, so that searching doesn't depend on a
+remote service.
+
+Every (term, document) score only depends on the index, so they're
+computed when the index is built and a query only sums the scores of its
+terms. The last term of a query also matches the terms that it's a prefix
+of, so that results can be shown while typing.
+"""
+import heapq
+import math
+import re
+from bisect import bisect_left
+
+from .text_records import text_records
+
+# BM25 parameters: term frequency saturation and length normalization
+K1 = 1.2
+B = 0.75
+
+# the weight of a match in each field
+FIELD_WEIGHTS = {
+    'name': 3.0,
+    'section': 3.0,
+    'description': 2.0,
+    'content': 1.0
+}
+
+# the most terms that the last term of a query is expanded to
+PREFIX_EXPANSIONS = 50
+
+# the characters of content shown around the first match of a hit
+SNIPPET_BEFORE = 60
+SNIPPET_LENGTH = 200
+
+_word = re.compile(r'\w+', re.UNICODE)
+
+
+def tokenize(text):
+    """
+    Yield `(term, start, end)` for every word in `text`, where `term` is
+    the lowercased word and `text[start:end]` the word.
+    """
+    for match in _word.finditer(text):
+        yield match.group().lower(), match.start(), match.end()
+
+
+def text(tree):
+    """
+    The text of the components in `tree`, one record per line, see
+    `text_records`.
+    """
+    return u'\n'.join(record.text for record in text_records(tree))
+
+
+def sections(tree):
+    """
+    Split the text of `tree` into its sections that have an anchor (see
+    `utils.anchors`), as `(anchor, title, text)`. The first section is the
+    text before the first anchor, with an anchor and title of None.
+    """
+    anchor, title, lines = None, None, []
+    for record in text_records(tree):
+        if (record.kind == 'heading' and record.anchor is not None and
+                record.anchor != anchor):
+            yield anchor, title, u'\n'.join(lines)
+            anchor, title, lines = record.anchor, record.text, []
+        else:
+            lines.append(record.text)
+    yield anchor, title, u'\n'.join(lines)
+
+
+class SearchIndex(object):
+    """
+    A search index of `documents`, dicts with a (possibly empty) string
+    for each field of `fields`, a dict of field weights. Other keys of the
+    documents (e.g. their url) are returned with the hits.
+    """
+
+    def __init__(self, documents, fields=FIELD_WEIGHTS):
+        self.documents = documents
+        self.fields = fields
+        # term: [(document index, score)]
+        self._postings = {}
+        # (term, document index): {field: [(start, end)]}
+        self._positions = {}
+
+        frequencies = {}
+        lengths = dict((field, []) for field in fields)
+        for i, document in enumerate(documents):
+            for field in fields:
+                length = 0
+                for term, start, end in tokenize(document.get(field) or u''):
+                    length += 1
+                    positions = self._positions.setdefault((term, i), {})
+                    positions.setdefault(field, []).append((start, end))
+                    counts = frequencies.setdefault((term, i), {})
+                    counts[field] = counts.get(field, 0) + 1
+                lengths[field].append(length)
+
+        average_lengths = dict(
+            (field, float(sum(lengths[field])) / len(documents) or 1)
+            for field in fields
+        ) if documents else {}
+
+        document_frequencies = {}
+        for term, _ in frequencies:
+            document_frequencies[term] = document_frequencies.get(term, 0) + 1
+
+        for (term, i), counts in frequencies.items():
+            n = document_frequencies[term]
+            idf = math.log(1 + (len(documents) - n + 0.5) / (n + 0.5))
+            score = idf * sum(
+                fields[field] * count * (K1 + 1) / (count + K1 * (
+                    1 - B + B * lengths[field][i] / average_lengths[field]))
+                for field, count in counts.items()
+            )
+            self._postings.setdefault(term, []).append((i, score))
+
+        self._terms = sorted(self._postings)
+
+    def __len__(self):
+        return len(self.documents)
+
+    @property
+    def terms(self):
+        return self._terms
+
+    def expand(self, prefix):
+        """
+        The terms that start with `prefix`, in alphabetical order.
+        """
+        terms = []
+        i = bisect_left(self._terms, prefix)
+        while (i < len(self._terms) and len(terms) < PREFIX_EXPANSIONS and
+               self._terms[i].startswith(prefix)):
+            terms.append(self._terms[i])
+            i += 1
+        return terms
+
+    def search(self, query, limit=10):
+        """
+        The `limit` best hits for `query`, best first. Each hit is a copy
+        of its document without its content, with its `score`, the
+        `highlights` of the matched terms in its fields as `(start, end)`
+        offsets and a `snippet` of the content around the first match (the
+        `text` and its `highlights`).
+        """
+        terms = [term for term, _, _ in tokenize(query)]
+        if not terms:
+            return []
+        # only the last term is matched as a prefix, the others are done
+        groups = [[term] for term in terms[:-1]] + [self.expand(terms[-1])]
+
+        scores = {}
+        matches = {}
+        for group in groups:
+            # a document's score for a group is that of its best term, so
+            # that a short prefix doesn't add up the score of every term
+            # that it expands to
+            best = {}
+            for term in group:
+                for i, score in self._postings.get(term, ()):
+                    if score > best.get(i, (0, None))[0]:
+                        best[i] = (score, term)
+            for i, (score, term) in best.items():
+                scores[i] = scores.get(i, 0) + score
+                matches.setdefault(i, []).append(term)
+
+        hits = heapq.nlargest(
+            limit, scores.items(), key=lambda hit: (hit[1], -hit[0]))
+        return [self._hit(i, score, matches[i]) for i, score in hits]
+
+    def _hit(self, i, score, terms):
+        hit = dict(self.documents[i])
+        content = hit.pop('content', None) or u''
+        positions = [self._positions[(term, i)] for term in terms]
+        hit['score'] = score
+        hit['highlights'] = dict(
+            (field, sorted(
+                offsets for p in positions for offsets in p.get(field, [])))
+            for field in self.fields if field != 'content'
+        )
+
+        content_offsets = sorted(
+            offsets for p in positions for offsets in p.get('content', []))
+        start = 0
+        if content_offsets:
+            start = max(0, content_offsets[0][0] - SNIPPET_BEFORE)
+        end = start + SNIPPET_LENGTH
+        hit['snippet'] = {
+            'text': content[start:end],
+            'highlights': [
+                (s - start, e - start) for s, e in content_offsets
+                if s >= start and e <= end
+            ]
+        }
+        return hit
@@ -0,0 +1,207 @@
+"""
+The text of a component tree as records for indexing: headings,
+paragraphs, Markdown, code blocks and table rows, each with the path of
+headings of the section that it's in and the anchor of that section.
+
+The tree is walked once, in document order, and records are yielded as
+they're found, so the text of a chapter is never held in one string.
+"""
+import re
+import textwrap
+from collections import namedtuple
+
+from six import string_types
+
+from .component_tree import children_of
+
+# kind: 'heading', 'paragraph', 'markdown', 'code' or 'row'
+# section: the titles of the headings that the record is under, including
+# the record itself for headings
+# anchor: the id of the innermost of those headings that has one (see
+# `utils.anchors`), or None
+TextRecord = namedtuple('TextRecord', ['kind', 'text', 'section', 'anchor'])
+
+_HEADINGS = dict(('H{}'.format(level), level) for level in range(1, 7))
+
+# components whose text is part of the text of their parent
+_INLINE = set([
+    'A', 'Abbr', 'B', 'Br', 'Cite', 'Code', 'Em', 'I', 'Kbd', 'Label',
+    'Link', 'Mark', 'Q', 'S', 'Samp', 'Small', 'Span', 'Strong', 'Sub',
+    'Sup', 'U', 'Var'
+])
+
+_CODE = set(['SyntaxHighlighter', 'Pre'])
+
+markdown_heading = re.compile(r'^ {0,3}(#{1,6})\s+(.*?)[\s#]*$')
+markdown_fence = re.compile(r'^ {0,3}(```|~~~)')
+
+
+def _string(value):
+    if isinstance(value, bytes):
+        return value.decode('utf-8')
+    return value
+
+
+def _type(node):
+    return type(node).__name__
+
+
+def flatten(tree):
+    """
+    All the text in `tree`, concatenated.
+    """
+    parts = []
+    stack = [tree]
+    while stack:
+        node = _string(stack.pop())
+        if isinstance(node, string_types):
+            parts.append(node)
+        elif isinstance(node, (list, tuple)):
+            stack.extend(reversed(node))
+        elif hasattr(node, 'to_plotly_json'):
+            stack.extend(reversed(children_of(node)))
+    return u''.join(parts)
+
+
+class _Sections(object):
+    """
+    The headings that the current position in the document is under.
+    """
+
+    def __init__(self):
+        self._headings = []
+
+    def enter(self, level, title, anchor=None):
+        while self._headings and self._headings[-1][0] >= level:
+            self._headings.pop()
+        self._headings.append((level, title, anchor))
+
+    def record(self, kind, text):
+        anchors = [a for _, _, a in self._headings if a is not None]
+        return TextRecord(
+            kind, text, tuple(title for _, title, _ in self._headings),
+            anchors[-1] if anchors else None)
+
+
+def _markdown_records(source, sections, anchor=None):
+    """
+    Split Markdown `source` at its headings (outside of code fences) into
+    heading, markdown and code records. `anchor` is the anchor of the
+    heading that the source starts with, if any.
+    """
+    lines = []
+    fence = None
+
+    def block(kind):
+        text = u'\n'.join(lines).strip()
+        del lines[:]
+        if text:
+            return [sections.record(kind, text)]
+        return []
+
+    for line in textwrap.dedent(source).split(u'\n'):
+        match = markdown_fence.match(line)
+        if fence is not None:
+            if match and match.group(1) == fence:
+                fence = None
+                for record in block('code'):
+                    yield record
+            else:
+                lines.append(line)
+        elif match:
+            for record in block('markdown'):
+                yield record
+            fence = match.group(1)
+        else:
+            heading = markdown_heading.match(line)
+            if heading:
+                for record in block('markdown'):
+                    yield record
+                sections.enter(len(heading.group(1)), heading.group(2),
+                               anchor)
+                yield sections.record('heading', heading.group(2))
+            else:
+                lines.append(line)
+        if line.strip():
+            # only the heading that starts the source has the anchor
+            anchor = None
+
+    for record in block('code' if fence is not None else 'markdown'):
+        yield record
+
+
+def _table_records(table, sections):
+    stack = [table]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (list, tuple)):
+            stack.extend(reversed(node))
+        elif _type(node) == 'Tr':
+            cells = [
+                cell for cell in children_of(node)
+                if _type(cell) in ('Td', 'Th')
+            ]
+            # the header row only names the columns
+            if any(_type(cell) == 'Td' for cell in cells):
+                text = u' | '.join(
+                    t for t in (flatten(cell).strip() for cell in cells) if t)
+                if text:
+                    yield sections.record('row', text)
+        elif hasattr(node, 'to_plotly_json'):
+            stack.extend(reversed(children_of(node)))
+
+
+def text_records(tree):
+    """
+    Yield a `TextRecord` for every heading, paragraph, Markdown block, code
+    block and table row in `tree`, in document order.
+    """
+    sections = _Sections()
+    stack = [tree]
+    while stack:
+        node = _string(stack.pop())
+        if isinstance(node, string_types):
+            if node.strip():
+                yield sections.record('paragraph', node.strip())
+            continue
+        if isinstance(node, (list, tuple)):
+            stack.extend(reversed(node))
+            continue
+        if not hasattr(node, 'to_plotly_json'):
+            continue
+
+        name = _type(node)
+        anchor = getattr(node, 'id', None)
+        if not isinstance(anchor, string_types):
+            anchor = None
+        if name in _HEADINGS:
+            title = flatten(node).strip()
+            if title:
+                sections.enter(_HEADINGS[name], title, anchor)
+                yield sections.record('heading', title)
+        elif name == 'Markdown':
+            for record in _markdown_records(
+                    flatten(node), sections, anchor):
+                yield record
+        elif name in _CODE:
+            code = flatten(node).strip('\n')
+            if code.strip():
+                yield sections.record('code', code)
+        elif name == 'Table':
+            for record in _table_records(node, sections):
+                yield record
+        else:
+            # each run of strings and inline components among the children
+            # is a paragraph, the other children are walked in between
+            parts = []
+            inline = []
+            for child in children_of(node):
+                child = _string(child)
+                if (isinstance(child, string_types) or
+                        _type(child) in _INLINE):
+                    inline.append(child)
+                else:
+                    parts.extend([flatten(inline), child])
+                    inline = []
+            parts.append(flatten(inline))
+            stack.extend(reversed(parts))